@@ -11,8 +11,8 @@ import plotly.graph_objects as go
 import random
 
 # Import the refactored modules
-from calculations import calcular_semanas, calcular_horas_por_categoria
-from charts import crear_grafico_torta, crear_grafico_barras, crear_grafico_circulos  # Import additional chart function
+from timeleft.calculations import calcular_semanas, calcular_horas_por_categoria
+from timeleft.charts import crear_grafico_torta, crear_grafico_barras, crear_grafico_circulos  # Import additional chart function
 from styles import get_styles
 
 # Remove inline definitions of charts and calculations
@@ -0,0 +1,25 @@
+# bench_calculations.py
+# Benchmarks of the week and hour helpers of calculations.py.
+
+from datetime import date
+
+import pytest
+
+from conftest import ESPERANZAS_VIDA
+from timeleft.calculations import calcular_horas_por_categoria, calcular_semanas
+
+FECHA_NACIMIENTO = date(1990, 5, 17)
+
+
+@pytest.mark.parametrize("esperanza_vida", ESPERANZAS_VIDA)
+def bench_calcular_semanas(benchmark, esperanza_vida):
+    fecha_fin = FECHA_NACIMIENTO.replace(year=FECHA_NACIMIENTO.year + esperanza_vida)
+    semanas = benchmark(calcular_semanas, FECHA_NACIMIENTO, fecha_fin)
+    assert semanas == (fecha_fin - FECHA_NACIMIENTO).days // 7
+
+
+@pytest.mark.parametrize("esperanza_vida", ESPERANZAS_VIDA)
+def bench_calcular_horas_por_categoria(benchmark, esperanza_vida):
+    dias_totales = esperanza_vida * 365
+    horas_dormidas, horas_trabajadas, horas_personales = benchmark(calcular_horas_por_categoria, dias_totales, 8, 8)
+    assert horas_dormidas + horas_trabajadas + horas_personales == dias_totales * 24
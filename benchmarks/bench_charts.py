@@ -0,0 +1,121 @@
+# bench_charts.py
+# Benchmarks of the chart builders of charts.py over lifespans and stage counts.
+#
+# Stage weeks come from calcular_calendario, computed outside the timed call.
+# The circle chart payload is also checked against the figure it replaced.
+
+from datetime import date
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+import pytest
+
+from conftest import CANTIDADES_ETAPAS, ESPERANZAS_VIDA, etapas_uniformes
+from timeleft.calendario import calcular_calendario
+from timeleft.charts import (
+    crear_grafico_barras,
+    crear_grafico_barras_acumulado,
+    crear_grafico_circulos,
+    crear_grafico_torta,
+)
+from timeleft.config import ETAPAS_DEFAULT
+from timeleft.linea_tiempo import LineaTiempo
+
+FECHA_NACIMIENTO = date(1990, 5, 17)
+FECHA_HOY = date(2026, 1, 1)
+
+# Casos del payload del gráfico de círculos: (esperanza de vida, columnas, días por punto)
+CASOS_PAYLOAD = {"vida_76": (76, 52, 7), "vida_120": (120, 52, 7), "vida_120_dias": (120, 365, 1)}
+# La figura con códigos enteros tiene que pesar a lo sumo esta fracción de la anterior
+PAYLOAD_FRACCION_MAXIMA = 0.5
+PAYLOAD_BYTES_POR_PUNTO_MAXIMO = 10
+
+parametros = pytest.mark.parametrize(
+    "esperanza_vida, cantidad_etapas",
+    [(esperanza, cantidad) for esperanza in ESPERANZAS_VIDA for cantidad in CANTIDADES_ETAPAS],
+)
+
+
+def crear_calendario(esperanza_vida, cantidad_etapas):
+    etapas = etapas_uniformes(esperanza_vida, cantidad_etapas)
+    return calcular_calendario(FECHA_NACIMIENTO, esperanza_vida, etapas, FECHA_HOY)
+
+
+@parametros
+def bench_crear_grafico_torta(benchmark, esperanza_vida, cantidad_etapas):
+    calendario = crear_calendario(esperanza_vida, cantidad_etapas)
+    fig = benchmark(crear_grafico_torta, list(calendario.index), calendario["Semanas"].tolist(), "Semanas por etapa")
+    assert len(fig.data[0].labels) == cantidad_etapas
+
+
+@parametros
+def bench_crear_grafico_barras(benchmark, esperanza_vida, cantidad_etapas):
+    calendario = crear_calendario(esperanza_vida, cantidad_etapas)
+    semanas_por_etapa = calendario["Semanas"].to_dict()
+    fig = benchmark(crear_grafico_barras, semanas_por_etapa, calendario["Color"].tolist(), 0)
+    assert len(fig.data) == cantidad_etapas
+
+
+@parametros
+def bench_crear_grafico_barras_acumulado(benchmark, esperanza_vida, cantidad_etapas):
+    calendario = crear_calendario(esperanza_vida, cantidad_etapas)
+    semanas_por_etapa = calendario["Semanas vividas"].to_dict()
+    semanas_vividas = int(calendario["Semanas vividas"].sum())
+    fig = benchmark(crear_grafico_barras_acumulado, semanas_por_etapa, calendario["Color"].to_dict(), semanas_vividas)
+    assert len(fig.data) == cantidad_etapas + 1
+
+
+@parametros
+def bench_crear_grafico_circulos(benchmark, esperanza_vida, cantidad_etapas):
+    calendario = crear_calendario(esperanza_vida, cantidad_etapas)
+    linea_tiempo = LineaTiempo.desde_semanas(calendario.index, calendario["Color"], calendario["Semanas"])
+    semanas_totales = linea_tiempo.total_semanas
+    cols = 52
+    rows = semanas_totales // cols + 1
+    x = np.tile(np.arange(cols), rows)[:semanas_totales]
+    y = np.repeat(np.arange(rows), cols)[:semanas_totales]
+    semanas_vividas = int(calendario["Semanas vividas"].sum())
+    fig = benchmark(
+        crear_grafico_circulos, x, y, linea_tiempo.expandir(), linea_tiempo.colores, semanas_vividas - 1, "Benchmark"
+    )
+    assert len(fig.data[0].x) == semanas_totales
+
+
+def figura_anterior(x, y, color_list, nombre):
+    """Rebuild the circle chart the way it was serialized before the integer codes."""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=x.tolist(),
+        y=(-y).tolist(),
+        mode='markers',
+        marker=dict(size=6, color=color_list, opacity=0.8),
+        text=[f"Semana {i+1}" for i in range(len(x))],
+        hoverinfo='text'
+    ))
+    fig.update_layout(title=f"Semanas de vida de {nombre}", showlegend=False)
+    return fig
+
+
+@pytest.mark.parametrize("caso", list(CASOS_PAYLOAD))
+def bench_payload_grafico_circulos(benchmark, caso):
+    esperanza_vida, cols, dias = CASOS_PAYLOAD[caso]
+    colores = [etapa["color"] for etapa in ETAPAS_DEFAULT]
+    puntos = esperanza_vida * 365 // dias
+    limites = np.linspace(0, puntos, len(colores) + 1).astype(int)
+    codigos = np.repeat(np.arange(len(colores)), np.diff(limites))
+    rows = puntos // cols + 1
+    x = np.tile(np.arange(cols), rows)[:puntos]
+    y = np.repeat(np.arange(rows), cols)[:puntos]
+    semana_actual = puntos // 2
+
+    color_list = [colores[c] for c in codigos]
+    color_list[semana_actual] = "#FF0000"
+    antes = len(pio.to_json(figura_anterior(x, y, color_list, "Benchmark")).encode())
+    figura = crear_grafico_circulos(x, y, codigos, colores, semana_actual, "Benchmark", render_mode="svg")
+    # Se mide la serialización, que es lo que se paga en cada rerun
+    despues = len(benchmark(pio.to_json, figura).encode())
+
+    benchmark.extra_info.update({"bytes_antes": antes, "bytes_despues": despues, "reduccion": 1 - despues / antes})
+    assert despues <= antes * PAYLOAD_FRACCION_MAXIMA
+    assert despues <= puntos * PAYLOAD_BYTES_POR_PUNTO_MAXIMO
@@ -0,0 +1,65 @@
+# bench_etapas.py
+# Benchmarks of the stage pipeline: normalization, calendar and the full profile.
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from conftest import CANTIDADES_ETAPAS, ESPERANZAS_VIDA, etapas_uniformes
+from timeleft.calendario import calcular_calendario, calcular_semanas_etapas
+from timeleft.etapas import Etapa, _normalizar_cacheado
+from timeleft.figuras import _figuras_semanales_cacheadas
+from timeleft.perfil import compute_profile
+
+FECHA_NACIMIENTO = date(1990, 5, 17)
+FECHA_HOY = date(2026, 1, 1)
+
+parametros = pytest.mark.parametrize(
+    "esperanza_vida, cantidad_etapas",
+    [(esperanza, cantidad) for esperanza in ESPERANZAS_VIDA for cantidad in CANTIDADES_ETAPAS],
+)
+
+
+@parametros
+def bench_calcular_calendario(benchmark, esperanza_vida, cantidad_etapas):
+    etapas = etapas_uniformes(esperanza_vida, cantidad_etapas)
+    calendario = benchmark(calcular_calendario, FECHA_NACIMIENTO, esperanza_vida, etapas, FECHA_HOY)
+    assert len(calendario) == cantidad_etapas
+
+
+@pytest.mark.parametrize("cantidad_personas", [1, 1000, 100_000])
+def bench_calcular_semanas_etapas(benchmark, cantidad_personas):
+    rng = np.random.default_rng(0)
+    nacimientos = np.datetime64("1940-01-01") + rng.integers(0, 30_000, size=cantidad_personas)
+    edades = np.array([0, 5, 18, 24, 37, 65, 76])
+    _, _, semanas = benchmark(calcular_semanas_etapas, nacimientos, 76, edades[:-1], edades[1:])
+    assert semanas.shape == (cantidad_personas, 6)
+
+
+@parametros
+def bench_compute_profile(benchmark, esperanza_vida, cantidad_etapas):
+    etapas = tuple(etapas_uniformes(esperanza_vida, cantidad_etapas))
+
+    def calcular():
+        # Sin caché semanal: se mide el perfil completo, figuras incluidas
+        _figuras_semanales_cacheadas.cache_clear()
+        perfil = compute_profile(
+            "Benchmark", FECHA_NACIMIENTO, esperanza_vida, min(65, esperanza_vida), 8, 8, etapas, FECHA_HOY
+        )
+        perfil.figuras()
+        return perfil
+
+    perfil = benchmark(calcular)
+    # Etapas normalizadas: sin semanas contadas dos veces
+    assert perfil.calendario["Semanas"].sum() <= perfil.semanas_totales
+
+
+@pytest.mark.parametrize("cantidad_etapas", [6, 500, 5000])
+def bench_normalizar_etapas(benchmark, cantidad_etapas):
+    rng = np.random.default_rng(0)
+    edades = rng.integers(0, 121, size=(cantidad_etapas, 2))
+    etapas = [Etapa(f"Etapa {k}", int(a), int(b), "#000000") for k, (a, b) in enumerate(edades)]
+    # Sin caché: se mide la normalización, no la búsqueda por contenido
+    normalizadas = benchmark(lambda: _normalizar_cacheado.__wrapped__(tuple(etapas), 100))
+    assert normalizadas[0].edad_inicio == 0 and normalizadas[-1].edad_fin == 100
@@ -0,0 +1,55 @@
+# bench_mortalidad.py
+# Benchmarks of the life tables: loading, vectorized queries, the cached sidebar
+# lookup, the Monte Carlo lifespan simulation and the expected free time.
+
+import numpy as np
+import pytest
+
+from timeleft.config import SIMULACION_MUESTRAS, SIMULACION_PRESUPUESTO_MS
+from timeleft.mortalidad import TablaMortalidad, cargar_tabla_mortalidad, esperanza_vida_para_edad
+from timeleft.simulacion import simular_semanas_restantes
+from timeleft.tiempo_esperado import calcular_tiempo_esperado, supervivencia_semanal, tiempo_esperado
+
+
+def bench_cargar_tabla(benchmark):
+    tabla = benchmark(TablaMortalidad.desde_csv)
+    assert np.all(tabla.lx[:, -1] == 0)
+
+
+@pytest.mark.parametrize("cantidad_edades", [1, 1000, 1_000_000])
+def bench_esperanza_restante(benchmark, cantidad_edades):
+    tabla = cargar_tabla_mortalidad()
+    edades = np.random.default_rng(0).uniform(0, 120, size=cantidad_edades)
+    filas = np.arange(cantidad_edades) % len(tabla.claves)
+    restantes = benchmark(tabla.esperanza_restante, filas, edades)
+    assert np.all(restantes >= 0)
+
+
+def bench_esperanza_vida_para_edad(benchmark):
+    # Consulta repetida de la barra lateral: sale de la caché
+    esperanza = benchmark(esperanza_vida_para_edad, "CL", "T", 38.4)
+    assert esperanza > 38.4
+
+
+@pytest.mark.parametrize("muestras", [1000, SIMULACION_MUESTRAS])
+def bench_simular_semanas_restantes(benchmark, muestras):
+    tabla = cargar_tabla_mortalidad()
+    semanas = benchmark(simular_semanas_restantes, tabla, tabla.fila("CL", "T"), 38.4, muestras, 0)
+    assert len(semanas) == muestras and np.all(np.diff(semanas) >= 0)
+    # Sin caché, la simulación completa tiene que entrar en el presupuesto del rerun
+    if benchmark.stats is not None:
+        assert benchmark.stats.stats.mean * 1000 < SIMULACION_PRESUPUESTO_MS
+
+
+def bench_tiempo_esperado_sin_cache(benchmark):
+    tabla = cargar_tabla_mortalidad()
+    fila = tabla.fila("CL", "T")
+    esperado = benchmark(lambda: calcular_tiempo_esperado(supervivencia_semanal(tabla, fila, 38.4), 53))
+    assert 0 < esperado.semanas < (tabla.edad_maxima - 38.4) * 53
+
+
+def bench_tiempo_esperado_slider(benchmark):
+    # Mover un slider de horas solo cambia las horas: la curva de supervivencia sale de la caché
+    horas = iter(np.tile(np.arange(20, 100), 100_000))
+    esperado = benchmark(lambda: tiempo_esperado("CL", "T", 38.4, int(next(horas))))
+    assert esperado.horas_libres > 0
@@ -0,0 +1,83 @@
+# calculations_vectorizado.py
+# Benchmark of the scalar and vectorized helpers of calculations.py.
+#
+# Usage:
+#     python benchmarks/calculations_vectorizado.py [filas]
+#
+# Builds a table of random birthdates and hour settings (1M rows by default),
+# runs both versions over it, checks that they agree and prints the times.
+
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timeleft.calculations import (  # noqa: E402
+    calcular_horas_por_categoria,
+    calcular_horas_por_categoria_vectorizado,
+    calcular_semanas,
+    calcular_semanas_vectorizado,
+)
+
+
+def crear_tabla(filas, semilla=0):
+    """Random birthdates, a fixed reference date and sleep/work hours."""
+    rng = np.random.default_rng(semilla)
+    nacimientos = np.datetime64("1930-01-01") + rng.integers(0, 365 * 90, filas).astype("timedelta64[D]")
+    return pd.DataFrame({
+        "fecha_nacimiento": pd.to_datetime(nacimientos),
+        "fecha_hoy": pd.Timestamp(datetime(2026, 1, 1)),
+        "horas_dormir": rng.integers(4, 13, filas),
+        "horas_trabajo": rng.integers(4, 13, filas),
+    })
+
+
+def cronometrar(funcion):
+    """Run funcion once and return (result, seconds)."""
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    filas = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tabla = crear_tabla(filas)
+    inicios = tabla["fecha_nacimiento"].tolist()
+    fines = tabla["fecha_hoy"].tolist()
+
+    semanas_escalar, t_semanas_escalar = cronometrar(
+        lambda: np.array([calcular_semanas(i, f) for i, f in zip(inicios, fines)])
+    )
+    semanas, t_semanas = cronometrar(
+        lambda: calcular_semanas_vectorizado(tabla["fecha_nacimiento"], tabla["fecha_hoy"])
+    )
+    assert np.array_equal(semanas_escalar, semanas)
+
+    dias = semanas * 7
+    horas_escalar, t_horas_escalar = cronometrar(
+        lambda: np.array([
+            calcular_horas_por_categoria(d, hd, ht)
+            for d, hd, ht in zip(dias.tolist(), tabla["horas_dormir"].tolist(), tabla["horas_trabajo"].tolist())
+        ]).T
+    )
+    horas, t_horas = cronometrar(
+        lambda: calcular_horas_por_categoria_vectorizado(dias, tabla["horas_dormir"], tabla["horas_trabajo"])
+    )
+    assert np.array_equal(horas_escalar, np.array(horas))
+
+    print(f"{filas:,} filas")
+    print(f"{'Función':<32}{'Escalar (s)':>14}{'Vectorizada (s)':>18}{'Aceleración':>14}")
+    for nombre, t_escalar, t_vector in (
+        ("calcular_semanas", t_semanas_escalar, t_semanas),
+        ("calcular_horas_por_categoria", t_horas_escalar, t_horas),
+    ):
+        print(f"{nombre:<32}{t_escalar:>14.3f}{t_vector:>18.4f}{t_escalar / t_vector:>13.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# circulos_webgl.py
+# Browser-side timing comparison of the SVG and WebGL circle charts.
+#
+# Usage:
+#     python benchmarks/circulos_webgl.py [salida.html]
+#
+# Open the generated page in the browser to test (ideally on the target
+# phone). It draws the chart for several lifespans with both render modes and
+# reports the time of the first Plotly.newPlot and the mean time of a pan
+# (Plotly.relayout) for each one.
+
+import json
+import os
+import sys
+
+import numpy as np
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timeleft.charts import crear_grafico_circulos  # noqa: E402
+
+ESPERANZAS_VIDA = (76, 120)
+RESOLUCIONES = {"semanas": (52, 7), "días": (365, 1)}
+PANEOS = 20
+
+PLANTILLA = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Gráfico de círculos: SVG vs WebGL</title>{plotlyjs}</head>
+<body>
+<h1>Gráfico de círculos: SVG vs WebGL</h1>
+<table border="1" cellpadding="4" id="resultados">
+<tr><th>Caso</th><th>Puntos</th><th>Modo</th><th>newPlot (ms)</th><th>Paneo medio (ms)</th></tr>
+</table>
+<div id="grafico" style="width:100%;height:600px"></div>
+<script>
+const casos = {casos};
+const PANEOS = {paneos};
+async function medir() {{
+    const div = document.getElementById("grafico");
+    const tabla = document.getElementById("resultados");
+    for (const caso of casos) {{
+        Plotly.purge(div);
+        let t0 = performance.now();
+        await Plotly.newPlot(div, caso.figura.data, caso.figura.layout);
+        const tPlot = performance.now() - t0;
+        t0 = performance.now();
+        for (let i = 0; i < PANEOS; i++) {{
+            await Plotly.relayout(div, {{"xaxis.range": [i, i + 52]}});
+        }}
+        const tPaneo = (performance.now() - t0) / PANEOS;
+        const fila = tabla.insertRow();
+        for (const valor of [caso.nombre, caso.puntos, caso.modo, tPlot.toFixed(1), tPaneo.toFixed(1)]) {{
+            fila.insertCell().textContent = valor;
+        }}
+    }}
+    Plotly.purge(div);
+}}
+medir();
+</script>
+</body>
+</html>
+"""
+
+
+def construir_casos():
+    """Build the SVG and WebGL figures for every lifespan and resolution."""
+    casos = []
+    for esperanza_vida in ESPERANZAS_VIDA:
+        for resolucion, (cols, dias) in RESOLUCIONES.items():
+            puntos = esperanza_vida * 365 // dias
+            rows = puntos // cols + 1
+            x = np.tile(np.arange(cols), rows)[:puntos]
+            y = np.repeat(np.arange(rows), cols)[:puntos]
+            codigos = (np.arange(puntos) >= puntos // 2).astype(np.int16)
+            for modo in ("svg", "webgl"):
+                fig = crear_grafico_circulos(x, y, codigos, ["#FF8C00", "#F8F8FF"], puntos // 2, "Benchmark", render_mode=modo)
+                casos.append({
+                    "nombre": f"{esperanza_vida} años en {resolucion}",
+                    "puntos": puntos,
+                    "modo": modo,
+                    "figura": json.loads(pio.to_json(fig)),
+                })
+    return casos
+
+
+def main():
+    salida = sys.argv[1] if len(sys.argv) > 1 else "circulos_webgl.html"
+    plotlyjs = f"<script>{get_plotlyjs()}</script>"
+    html = PLANTILLA.format(plotlyjs=plotlyjs, casos=json.dumps(construir_casos()), paneos=PANEOS)
+    with open(salida, "w", encoding="utf-8") as f:
+        f.write(html)
+    print(f"✅ Comparación guardada en: {salida}")
+
+
+if __name__ == "__main__":
+    main()
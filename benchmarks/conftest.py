@@ -0,0 +1,90 @@
+# conftest.py
+# Shared setup of the pytest-benchmark suite.
+#
+# Usage:
+#     pytest benchmarks --benchmark-autosave            # store a baseline
+#     pytest benchmarks --regresion-maxima 10           # compare against the last baseline
+#
+# Baselines are stored in benchmarks/.baselines (per machine, not versioned).
+# --regresion-maxima N (or TIMELEFT_REGRESION_MAXIMA=N) compares the run with
+# the latest stored baseline and fails when a mean time grows more than N%.
+# Without a stored baseline the comparison is skipped with a notice.
+
+import glob
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pytest_benchmark.utils import parse_compare_fail  # noqa: E402
+
+CARPETA_BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".baselines")
+ALMACEN_POR_DEFECTO = "file://./.benchmarks"
+
+SIN_BASELINE = pytest.StashKey[bool]()
+
+ESPERANZAS_VIDA = [1, 10, 40, 76, 100, 120]
+CANTIDADES_ETAPAS = [6, 50, 200, 500]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--regresion-maxima",
+        type=int,
+        default=os.environ.get("TIMELEFT_REGRESION_MAXIMA"),
+        help="porcentaje máximo de regresión del tiempo medio frente al último baseline",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # Runs before pytest-benchmark builds its session from these options
+    if config.option.benchmark_storage == ALMACEN_POR_DEFECTO:
+        config.option.benchmark_storage = f"file://{CARPETA_BASELINES}"
+    regresion_maxima = config.getoption("regresion_maxima")
+    if regresion_maxima is None:
+        return
+    if not config.option.benchmark_compare and not _hay_baseline(config.option.benchmark_storage):
+        # pytest-benchmark falla si se pide comparar sin nada guardado: se omite la comparación
+        config.stash[SIN_BASELINE] = True
+        return
+    config.option.benchmark_compare = config.option.benchmark_compare or True
+    config.option.benchmark_compare_fail = [parse_compare_fail(f"mean:{int(regresion_maxima)}%")]
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if config.stash.get(SIN_BASELINE, False):
+        terminalreporter.write_line(
+            "--regresion-maxima: no hay un baseline guardado, no se comparó nada. "
+            "Guardá uno primero con: pytest benchmarks --benchmark-autosave",
+            yellow=True,
+            bold=True,
+        )
+
+
+def _hay_baseline(almacen):
+    """Whether a benchmark storage holds at least one saved run."""
+    if not almacen.startswith("file://"):
+        # Otros almacenes (p. ej. elasticsearch): que pytest-benchmark lo resuelva
+        return True
+    return bool(glob.glob(os.path.join(almacen[len("file://"):], "*", "*.json")))
+
+
+def etapas_uniformes(esperanza_vida, cantidad):
+    """
+    Build cantidad contiguous stages that split esperanza_vida evenly.
+
+    Ages are whole years, so with more stages than years some stages are empty.
+
+    Returns:
+        list: (nombre, edad_inicio, edad_fin, color) tuples, like the app's stages.
+    """
+    limites = np.round(np.linspace(0, esperanza_vida, cantidad + 1)).astype(int)
+    colores = [f"#{(k * 2654435761) & 0xFFFFFF:06X}" for k in range(cantidad)]
+    return [
+        (f"Etapa {k}", int(limites[k]), int(limites[k + 1]), colores[k])
+        for k in range(cantidad)
+    ]
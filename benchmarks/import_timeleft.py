@@ -0,0 +1,102 @@
+# import_timeleft.py
+# Measures the startup cost of `import timeleft` and of its first real use
+# against a bare interpreter.
+#
+# Usage:
+#     python benchmarks/import_timeleft.py [presupuesto_ms] [presupuesto_perfil_ms]
+#
+# Each case runs in a fresh interpreter several times and the median is
+# reported. The script exits with an error if `import timeleft` costs more
+# than its budget (20 ms by default), if `from timeleft import
+# compute_profile` costs more than its budget (50 ms by default) on top of
+# numpy and pandas, which the computation needs anyway, if any case imports
+# Streamlit or if the headless cases import Plotly.
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPETICIONES = 15
+PRESUPUESTO_MS = 20.0
+PRESUPUESTO_PERFIL_MS = 50.0
+
+CASOS = {
+    "intérprete": "pass",
+    "numpy y pandas": "import numpy, pandas",
+    "import timeleft": "import timeleft",
+    "from timeleft import compute_profile": "from timeleft import compute_profile",
+    "import timeleft.lote": "import timeleft.lote",
+}
+# Dependencias que compute_profile necesita de todos modos: su costo se descuenta
+# midiendo dentro del mismo intérprete, ya importadas, y no restando dos medianas
+DEPENDENCIAS_PERFIL = "import numpy, pandas"
+
+# Casos que no dibujan nada: no deben cargar Plotly
+CASOS_SIN_PLOTLY = ("import timeleft", "from timeleft import compute_profile", "import timeleft.lote")
+
+CHEQUEO_STREAMLIT = "; import sys; assert 'streamlit' not in sys.modules, 'streamlit importado'"
+CHEQUEO_PLOTLY = "; assert 'plotly' not in sys.modules, 'plotly importado'"
+
+
+def medir(codigo):
+    """Median wall time in ms of running codigo in a fresh interpreter."""
+    tiempos = []
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, check=True)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def medir_sobre(previo, codigo):
+    """Median time in ms of running codigo after previo, measured inside a fresh interpreter."""
+    cronometrado = (
+        f"{previo}; import time; inicio = time.perf_counter(); {codigo}; "
+        "print((time.perf_counter() - inicio) * 1000)"
+    )
+    tiempos = []
+    for _ in range(REPETICIONES):
+        salida = subprocess.run(
+            [sys.executable, "-c", cronometrado], cwd=RAIZ, check=True, capture_output=True, text=True
+        )
+        tiempos.append(float(salida.stdout))
+    return statistics.median(tiempos)
+
+
+def main():
+    presupuesto = float(sys.argv[1]) if len(sys.argv) > 1 else PRESUPUESTO_MS
+    presupuesto_perfil = float(sys.argv[2]) if len(sys.argv) > 2 else PRESUPUESTO_PERFIL_MS
+    resultados = {
+        nombre: medir(codigo + CHEQUEO_STREAMLIT + (CHEQUEO_PLOTLY if nombre in CASOS_SIN_PLOTLY else ""))
+        for nombre, codigo in CASOS.items()
+    }
+    base = resultados["intérprete"]
+    for nombre, ms in resultados.items():
+        print(f"{nombre:<40}{ms:>9.1f} ms  (+{ms - base:.1f} ms)")
+
+    excedidos = []
+    costo = resultados["import timeleft"] - base
+    if costo > presupuesto:
+        excedidos.append(f"import timeleft tarda {costo:.1f} ms, presupuesto {presupuesto:.1f} ms")
+    else:
+        print(f"✅ import timeleft: {costo:.1f} ms (presupuesto {presupuesto:.1f} ms)")
+    costo_perfil = medir_sobre(DEPENDENCIAS_PERFIL, CASOS["from timeleft import compute_profile"])
+    if costo_perfil > presupuesto_perfil:
+        excedidos.append(
+            f"from timeleft import compute_profile tarda {costo_perfil:.1f} ms sobre numpy y pandas, "
+            f"presupuesto {presupuesto_perfil:.1f} ms"
+        )
+    else:
+        print(
+            f"✅ from timeleft import compute_profile: {costo_perfil:.1f} ms sobre numpy y pandas "
+            f"(presupuesto {presupuesto_perfil:.1f} ms)"
+        )
+    if excedidos:
+        sys.exit("❌ " + "\n❌ ".join(excedidos))
+
+
+if __name__ == "__main__":
+    main()
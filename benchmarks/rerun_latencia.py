@@ -0,0 +1,254 @@
+# rerun_latencia.py
+# End-to-end rerun latency of the Streamlit entry points with AppTest.
+#
+# Usage:
+#     python benchmarks/rerun_latencia.py [--apps app.py app_full.py] [--repeticiones 3] [--salida benchmarks/reportes] [--fragmentos]
+#
+# Every entry point is loaded with streamlit.testing.v1.AppTest and driven
+# through the scripted widget sequences of SECUENCIAS (birthdate, lifespan,
+# hour sliders) plus its own ones in SECUENCIAS_POR_APP (stage editing and
+# chart view, whose widgets differ between entry points). Each step changes
+# one widget and triggers one rerun, whose wall time is recorded. A step on a
+# widget the entry point did not render is an error, so a renamed key cannot
+# silently shrink the benchmark. The report per entry point has
+# p50/p95/p99 per sequence and overall, and is written as
+# latencia_<app>.json so runs on different commits can be compared.
+#
+# AppTest always reruns the whole script, even for widgets inside an
+# st.fragment. With --fragmentos the apps run with ?debug=1 and, for the
+# widgets of FRAGMENTOS, the report also compares the total of the debug panel
+# (a full rerun) with the fragment's own section (what a fragment-scoped rerun
+# costs in the browser).
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from timeleft.etapas import Etapa  # noqa: E402
+
+# app_modularizado.py no está: llama a st.set_page_config después de otro comando y se
+# detiene antes de dibujar un solo widget
+APPS = ["app.py", "app_full.py"]
+REPETICIONES = 3
+TIMEOUT = 120
+PERCENTILES = (50, 95, 99)
+
+# Lotes de etapas como los que aplica el formulario del editor st.data_editor de app.py
+ETAPAS_BASE = (
+    Etapa("De nacimiento a conciencia", 0, 5, "#FFD700"),
+    Etapa("Infancia consciente", 5, 18, "#87CEEB"),
+    Etapa("Universidad", 18, 24, "#32CD32"),
+    Etapa("Carrera", 24, 37, "#FF8C00"),
+    Etapa("Hasta jubilarte", 37, 65, "#FFA07A"),
+    Etapa("Jubilación", 65, 76, "#F8F8FF"),
+)
+ETAPAS_EDITADAS = ETAPAS_BASE[:2] + (
+    Etapa("Colegio", 18, 26, "#123456"),
+    Etapa("Paternidad", 30, 50, "#AA00AA"),
+) + ETAPAS_BASE[3:]
+
+# Secuencias: nombre -> pasos (tipo de widget, key, valor), un rerun por paso.
+# El tipo "session_state" asigna las entradas del dict valor, como lo hace app.py al
+# aplicar el formulario de etapas; la key del paso es solo su nombre en el reporte.
+SECUENCIAS = {
+    "fecha_nacimiento": [
+        ("date_input", "sidebar_fecha_nacimiento", fecha)
+        for fecha in (date(1950, 3, 1), date(1975, 8, 15), date(2000, 2, 29), date(1988, 5, 19))
+    ],
+    "esperanza_vida": [
+        ("number_input", "sidebar_esperanza_vida", años) for años in (1, 40, 100, 120, 76)
+    ],
+    "horas": [
+        ("slider", "slider_horas_dormir", 6),
+        ("slider", "slider_horas_trabajo", 10),
+        ("slider", "slider_horas_dormir", 9),
+        ("slider", "slider_horas_trabajo", 4),
+        ("slider", "slider_horas_dormir", 8),
+        ("slider", "slider_horas_trabajo", 8),
+    ],
+}
+
+# Etapas y vista de cada entrada: app.py tiene el formulario de etapas y la grilla en un
+# fragmento; las apps anteriores, un expander por etapa y un selectbox de etapa
+_SECUENCIAS_EXPANDERS = {
+    "etapas": [
+        ("number_input", "edad_fin_etapa_2", 26),
+        ("number_input", "edad_fin_etapa_3", 45),
+        ("text_input", "nombre_etapa_1", "Colegio"),
+        ("color_picker", "color_etapa_0", "#123456"),
+        ("number_input", "edad_fin_etapa_5", 90),
+    ],
+    "vista": [
+        ("selectbox", "selectbox_etapa", "Infancia consciente"),
+        ("selectbox", "selectbox_etapa", "Total"),
+    ],
+}
+SECUENCIAS_POR_APP = {
+    "app.py": {
+        "etapas": [
+            ("session_state", "etapas_input", {"etapas_input": ETAPAS_EDITADAS, "etapas_personalizadas": True}),
+            ("session_state", "etapas_input", {"etapas_input": ETAPAS_BASE, "etapas_personalizadas": True}),
+        ],
+        "vista": [
+            ("radio", "vista_grilla", "Imagen"),
+            ("radio", "vista_grilla", "Interactivo"),
+        ],
+    },
+    "app_full.py": _SECUENCIAS_EXPANDERS,
+}
+
+# Widgets dentro de un st.fragment -> prefijo de su sección en el panel ?debug=1
+FRAGMENTOS = {
+    "vista_grilla": "Grilla de semanas",
+}
+
+
+def _widget(at, tipo, key, archivo):
+    """Widget of type tipo with the given key; raises LookupError if archivo did not render it."""
+    for widget in at.get(tipo):
+        if widget.key == key:
+            return widget
+    raise LookupError(f"{archivo}: no hay un widget {tipo} con key {key!r}")
+
+
+def _rerun(at, ejecutar):
+    """Run one rerun and return (seconds, whether the script raised)."""
+    inicio = time.perf_counter()
+    ejecutar()
+    return time.perf_counter() - inicio, int(len(at.exception) > 0)
+
+
+def _ms_secciones(at):
+    """Milliseconds per section from the ?debug=1 panel, or None if the app has no panel."""
+    for tabla in at.dataframe:
+        valores = tabla.value
+        if "ms" in valores.columns and "Total" in valores.index:
+            return valores["ms"]
+    return None
+
+
+def resumir(tiempos):
+    """Count, mean and p50/p95/p99 in milliseconds of a list of seconds."""
+    ms = np.asarray(tiempos, dtype=float) * 1000
+    if not len(ms):
+        return {"reruns": 0}
+    resumen = {"reruns": int(len(ms)), "media_ms": round(float(ms.mean()), 2)}
+    for percentil, valor in zip(PERCENTILES, np.percentile(ms, PERCENTILES)):
+        resumen[f"p{percentil}_ms"] = round(float(valor), 2)
+    return resumen
+
+
+def medir_app(archivo, repeticiones=REPETICIONES, fragmentos=False):
+    """
+    Drive one entry point through its sequences and time every rerun.
+
+    Parameters:
+        archivo (str): Script path, relative to the repo root.
+        repeticiones (int): How many times the whole set of sequences is replayed.
+        fragmentos (bool): Run with ?debug=1 and report the fragment-scoped
+            rerun time of the widgets in FRAGMENTOS.
+
+    Returns:
+        dict: Report with the cold first run, per-sequence and overall
+            summaries, the number of reruns that raised and, with
+            fragmentos, full vs fragment rerun times per widget.
+
+    Raises:
+        LookupError: If a step targets a widget the entry point did not render.
+    """
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    at = AppTest.from_file(os.path.join(RAIZ, archivo), default_timeout=TIMEOUT)
+    if fragmentos:
+        at.query_params["debug"] = "1"
+    primera, excepciones = _rerun(at, at.run)
+
+    secuencias = {**SECUENCIAS, **SECUENCIAS_POR_APP.get(os.path.basename(archivo), {})}
+    tiempos = {nombre: [] for nombre in secuencias}
+    completos = {key: [] for key in FRAGMENTOS}
+    en_fragmento = {key: [] for key in FRAGMENTOS}
+    for _ in range(repeticiones):
+        for nombre, pasos in secuencias.items():
+            for tipo, key, valor in pasos:
+                if tipo == "session_state":
+                    for clave, contenido in valor.items():
+                        at.session_state[clave] = contenido
+                    segundos, fallas = _rerun(at, at.run)
+                else:
+                    segundos, fallas = _rerun(at, _widget(at, tipo, key, archivo).set_value(valor).run)
+                tiempos[nombre].append(segundos)
+                excepciones += fallas
+                ms = _ms_secciones(at) if fragmentos and key in FRAGMENTOS else None
+                if ms is not None:
+                    # Ambos desde el panel, sin el costo de medir los payloads
+                    completos[key].append(ms["Total"] / 1000)
+                    en_fragmento[key].append(ms[ms.index.str.startswith(FRAGMENTOS[key])].sum() / 1000)
+
+    ahorros = {}
+    for key in FRAGMENTOS:
+        if not completos[key]:
+            continue
+        completo, fragmento = resumir(completos[key]), resumir(en_fragmento[key])
+        ahorros[key] = {
+            "rerun_completo": completo,
+            "rerun_fragmento": fragmento,
+            "ahorro_p50_%": round((1 - fragmento["p50_ms"] / completo["p50_ms"]) * 100, 1),
+        }
+
+    return {
+        "app": archivo,
+        "repeticiones": repeticiones,
+        "primera_ejecucion_ms": round(primera * 1000, 2),
+        "secuencias": {nombre: resumir(muestras) for nombre, muestras in tiempos.items()},
+        "total": resumir([t for muestras in tiempos.values() for t in muestras]),
+        "reruns_con_excepcion": excepciones,
+        "fragmentos": ahorros,
+        "muestras_ms": {nombre: [round(t * 1000, 2) for t in muestras] for nombre, muestras in tiempos.items()},
+    }
+
+
+def imprimir(reporte):
+    print(f"\n{reporte['app']}  (primera ejecución {reporte['primera_ejecucion_ms']:.0f} ms, "
+          f"{reporte['reruns_con_excepcion']} reruns con excepción)")
+    print(f"  {'Secuencia':<20}{'reruns':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for nombre, resumen in list(reporte["secuencias"].items()) + [("total", reporte["total"])]:
+        if not resumen["reruns"]:
+            print(f"  {nombre:<20}{0:>8}{'-':>10}{'-':>10}{'-':>10}")
+            continue
+        print(f"  {nombre:<20}{resumen['reruns']:>8}{resumen['p50_ms']:>10.1f}{resumen['p95_ms']:>10.1f}{resumen['p99_ms']:>10.1f}")
+    for key, ahorro in reporte["fragmentos"].items():
+        print(f"  fragmento {key}: rerun completo p50 {ahorro['rerun_completo']['p50_ms']:.1f} ms -> "
+              f"solo el fragmento p50 {ahorro['rerun_fragmento']['p50_ms']:.1f} ms ({ahorro['ahorro_p50_%']:.0f}% menos)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide la latencia de rerun de las apps con AppTest.")
+    parser.add_argument("--apps", nargs="+", default=APPS, help="scripts a medir")
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES, help="veces que se repiten las secuencias")
+    parser.add_argument("--fragmentos", action="store_true", help="estimar el rerun de los widgets dentro de st.fragment (usa ?debug=1)")
+    parser.add_argument("--salida", default=os.path.join(RAIZ, "benchmarks", "reportes"), help="carpeta de los reportes JSON")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.salida, exist_ok=True)
+    for archivo in args.apps:
+        reporte = medir_app(archivo, args.repeticiones, args.fragmentos)
+        imprimir(reporte)
+        ruta = os.path.join(args.salida, f"latencia_{os.path.splitext(os.path.basename(archivo))[0]}.json")
+        with open(ruta, "w", encoding="utf-8") as salida:
+            json.dump(reporte, salida, ensure_ascii=False, indent=2)
+        print(f"  -> {ruta}")
+
+
+if __name__ == "__main__":
+    main()
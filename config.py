@@ -1,13 +0,0 @@
-# config.py
-# This module contains default configurations and constants.
-
-ESPERANZA_VIDA_DEFAULT = 76
-
-ETAPAS_DEFAULT = [
-    {"nombre": "De nacimiento a conciencia", "edad_inicio": 0, "edad_fin": 5, "color": "#FFD700"},
-    {"nombre": "Infancia consciente", "edad_inicio": 5, "edad_fin": 18, "color": "#87CEEB"},
-    {"nombre": "Universidad y soltería", "edad_inicio": 18, "edad_fin": 24, "color": "#32CD32"},
-    {"nombre": "Carrera y noviazgo", "edad_inicio": 24, "edad_fin": 37, "color": "#FF8C00"},
-    {"nombre": "Hasta jubilarte", "edad_inicio": 37, "edad_fin": 65, "color": "#FFA07A"},
-    {"nombre": "Jubilación", "edad_inicio": 65, "edad_fin": 76, "color": "#F8F8FF"}
-]
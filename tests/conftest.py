@@ -0,0 +1,10 @@
+# conftest.py
+# Shared setup of the dashboard tests (Streamlit AppTest).
+#
+# Usage:
+#     pytest tests
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
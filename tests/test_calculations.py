@@ -0,0 +1,33 @@
+# test_calculations.py
+# The vectorized helpers must match their scalar counterparts.
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from timeleft.calculations import calcular_semanas, calcular_semanas_vectorizado
+
+
+def test_semanas_vectorizado_coincide_con_calcular_semanas():
+    generador = np.random.default_rng(0)
+    inicios = [datetime(2020, 1, 1) + timedelta(minutes=int(m)) for m in generador.integers(0, 10**6, 500)]
+    fines = [inicio + timedelta(minutes=int(m)) for inicio, m in zip(inicios, generador.integers(-10**5, 10**5, 500))]
+    # Horas distintas de medianoche: 6 días y 18 horas son 0 semanas
+    inicios.append(datetime(2020, 1, 1, 12))
+    fines.append(datetime(2020, 1, 8, 6))
+
+    esperadas = [calcular_semanas(inicio, fin) for inicio, fin in zip(inicios, fines)]
+
+    assert calcular_semanas_vectorizado(inicios, fines).tolist() == esperadas
+    assert calcular_semanas_vectorizado(pd.Series(inicios), pd.Series(fines)).tolist() == esperadas
+    assert calcular_semanas_vectorizado(np.array(inicios, dtype="datetime64[ns]"), fines).tolist() == esperadas
+
+
+def test_semanas_vectorizado_con_fechas():
+    inicios = [date(2000, 2, 29), date(1990, 1, 1)]
+    fines = [date(2026, 1, 1), date(1989, 1, 1)]
+
+    assert calcular_semanas_vectorizado(inicios, fines).tolist() == [
+        calcular_semanas(inicio, fin) for inicio, fin in zip(inicios, fines)
+    ]
@@ -0,0 +1,118 @@
+# test_editor_etapas.py
+# The stage editor form is the only source of the profile's stages; until it
+# is used, the default stages follow the life expectancy.
+
+import json
+import os
+
+import pytest
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from streamlit.testing.v1 import AppTest
+
+RUTA_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+BOTON_APLICAR = "FormSubmitter:form_etapas-Aplicar cambios"
+
+
+@pytest.fixture
+def app():
+    return AppTest.from_file(RUTA_APP, default_timeout=60).run()
+
+
+def enviar_editor(app, edited_rows=None, added_rows=None, deleted_rows=None):
+    """
+    Submit the stage form with a set of data_editor edits.
+
+    The edits are the JSON delta the browser sends for st.data_editor.
+    """
+    editor = app.sidebar.get("arrow_data_frame")[0]
+    app.button(key=BOTON_APLICAR).click()
+    cambios = {"edited_rows": edited_rows or {}, "added_rows": added_rows or [], "deleted_rows": deleted_rows or []}
+    return ejecutar_con_estado(app, editor.proto.id, json.dumps(cambios))
+
+
+def ejecutar_con_estado(app, id_widget, valor):
+    """
+    Rerun the app with the pending widget values plus a raw string value for one widget.
+
+    AppTest has no public API for st.data_editor, so this is the only place
+    that uses its private members: _tree.get_widget_states() collects the
+    pending values (e.g. a submit button click) and _run() reruns the
+    script with them. Written against Streamlit 1.39; if AppTest
+    changes, only this helper needs updating.
+    """
+    estados = app._tree.get_widget_states()
+    estados.widgets.append(WidgetState(id=id_widget, string_value=valor))
+    return app._run(estados)
+
+
+def nombres_grafico_barras(app):
+    """Stage names of the stacked bar chart, without the current week marker."""
+    datos = json.loads(app.get("plotly_chart")[0].proto.spec)["data"]
+    return [traza["name"] for traza in datos if traza["type"] == "bar"]
+
+
+def test_borrar_y_renombrar_etapas(app):
+    # Fila 0: "De nacimiento a conciencia"; fila 2: "Universidad"
+    enviar_editor(app, edited_rows={"2": {"Etapa": "Facultad"}}, deleted_rows=[0])
+
+    assert not app.exception
+    nombres = [etapa.nombre for etapa in app.session_state["etapas_input"]]
+    assert nombres == ["Infancia consciente", "Facultad", "Carrera", "Hasta jubilarte", "Jubilación"]
+    # La etapa borrada no vuelve: sus años quedan como hueco sin etapa
+    assert nombres_grafico_barras(app) == [
+        "Sin etapa (0-5)", "Infancia consciente", "Facultad", "Carrera", "Hasta jubilarte", "Jubilación"
+    ]
+
+
+def test_una_sola_etapa_personalizada(app):
+    enviar_editor(
+        app,
+        added_rows=[{"Etapa": "Toda la vida", "Edad inicio": 0, "Edad fin": 76, "Color": "#123456"}],
+        deleted_rows=list(range(6)),
+    )
+
+    assert not app.exception
+    assert nombres_grafico_barras(app) == ["Toda la vida"]
+
+
+def test_tabla_invalida_no_cambia_las_etapas(app):
+    etapas = app.session_state["etapas_input"]
+    enviar_editor(app, edited_rows={"1": {"Color": "azul"}})
+
+    assert app.sidebar.error
+    assert app.session_state["etapas_input"] == etapas
+
+
+def test_etapas_por_defecto_siguen_a_la_esperanza_de_vida(app):
+    app.selectbox(key="sidebar_pais").select("CL").run()
+
+    assert not app.exception
+    esperanza_vida = app.number_input(key="sidebar_esperanza_vida").value
+    assert esperanza_vida != 76
+    assert app.session_state["etapas_input"][-1].edad_fin == esperanza_vida
+    assert not any(nombre.startswith("Sin etapa") for nombre in nombres_grafico_barras(app))
+
+
+def test_etapas_editadas_no_se_vuelven_a_sembrar(app):
+    enviar_editor(app, edited_rows={"5": {"Etapa": "Retiro"}})
+    app.selectbox(key="sidebar_pais").select("CL").run()
+
+    assert not app.exception
+    assert tuple(app.session_state["etapas_input"][-1]) == ("Retiro", 65, 76, "#F8F8FF")
+
+
+@pytest.mark.parametrize(
+    ("clave", "edad"),
+    [("sidebar_esperanza_vida", 60), ("sidebar_edad_jubilacion", 30)],
+    ids=["esperanza_menor_que_jubilacion", "jubilacion_antes_de_37"],
+)
+def test_editar_una_celda_con_etapas_por_defecto_recortadas(app, clave, edad):
+    app.number_input(key=clave).set_value(edad).run()
+    # Las etapas sembradas no tienen filas vacías ni invertidas que el validador rechace
+    assert all(etapa.edad_inicio < etapa.edad_fin for etapa in app.session_state["etapas_input"])
+
+    enviar_editor(app, edited_rows={"0": {"Color": "#000000"}})
+
+    assert not app.exception
+    assert not app.sidebar.error
+    assert app.session_state["etapas_input"][0].color == "#000000"
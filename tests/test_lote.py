@@ -0,0 +1,37 @@
+# test_lote.py
+# The batch processor must agree with compute_profile row by row.
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from timeleft.lote import calcular_bloque
+from timeleft.perfil import compute_profile
+
+FECHA_HOY = date(2026, 1, 1)
+
+
+def test_calcular_bloque_coincide_con_compute_profile():
+    generador = np.random.default_rng(0)
+    n = 400
+    nacimientos = [date(1930, 1, 1) + timedelta(days=int(dias)) for dias in generador.integers(0, 35_000, n)]
+    bloque = pd.DataFrame({
+        "nombre": [f"p{i}" for i in range(n)],
+        "fecha_nacimiento": [nacimiento.isoformat() for nacimiento in nacimientos],
+        # Incluye jubilaciones antes de los 24 y esperanzas menores que la jubilación
+        "esperanza_vida": generador.integers(1, 121, n),
+        "edad_jubilacion": generador.integers(1, 121, n),
+    })
+    bloque.loc[0, ["fecha_nacimiento", "esperanza_vida", "edad_jubilacion"]] = ["1973-09-27", 37, 5]
+
+    resultado = calcular_bloque(bloque, FECHA_HOY)
+
+    for fila, salida in zip(bloque.itertuples(), resultado.itertuples()):
+        perfil = compute_profile(
+            fila.nombre, date.fromisoformat(fila.fecha_nacimiento), int(fila.esperanza_vida),
+            int(fila.edad_jubilacion), 8, 8, (), FECHA_HOY,
+        )
+        assert salida.semanas_vividas == perfil.semanas_vividas, fila
+        assert salida.semanas_restantes == perfil.semanas_restantes, fila
+        assert (salida.etapa_actual or None) == perfil.etapa_actual, fila
@@ -0,0 +1,22 @@
+# test_parametros_url.py
+# The dashboard reads its initial values from the URL query parameters.
+
+import os
+
+from streamlit.testing.v1 import AppTest
+
+RUTA_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def test_parametros_de_la_url():
+    app = AppTest.from_file(RUTA_APP, default_timeout=60)
+    app.query_params.update({"nombre": "Ana", "pais": "CL", "sexo": "F", "grilla": "imagen", "debug": "1"})
+    app.run()
+
+    assert not app.exception
+    assert app.text_input(key="sidebar_nombre").value == "Ana"
+    assert app.selectbox(key="sidebar_pais").value == "CL"
+    assert app.selectbox(key="sidebar_sexo").value == "F"
+    assert app.radio(key="vista_grilla").value == "Imagen"
+    # El panel ?debug=1 muestra los tiempos por sección
+    assert any("ms" in tabla.value.columns for tabla in app.dataframe)
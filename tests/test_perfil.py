@@ -0,0 +1,35 @@
+# test_perfil.py
+# The hours shown for a profile all come from its prefix-sum index.
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from timeleft.perfil import compute_profile
+
+
+@pytest.fixture
+def perfil():
+    return compute_profile("Ana", date(1990, 5, 17), 76, 65, 7, 9, (), date(2026, 1, 1))
+
+
+def test_total_de_la_torta_suma_las_etapas(perfil):
+    botones = perfil.fig_distribucion.layout.updatemenus[0].buttons
+    valores = {boton.label: boton.args[0]["values"][0] for boton in botones}
+
+    por_etapa = np.sum([valores[etapa] for etapa in perfil.linea_tiempo.nombres], axis=0)
+    assert valores["Total"] == por_etapa.tolist()
+    assert sum(valores["Total"]) == perfil.linea_tiempo.total_semanas * 7 * 24
+
+
+def test_tiempo_restante_usa_las_horas_elegidas(perfil):
+    assert perfil.horas_trabajo_futuro > 0
+    assert perfil.horas_personales_restantes > 0
+    assert list(perfil.fig_tiempo_restante.data[0].values) == [
+        perfil.horas_trabajo_futuro, perfil.horas_personales_restantes
+    ]
+
+    # 7 horas de sueño por día en todas las semanas, no las 8 fijas de antes
+    semanas = perfil.linea_tiempo.total_semanas
+    assert perfil.indice_horas.horas(0, semanas)[0] == semanas * 7 * 7
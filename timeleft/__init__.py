@@ -0,0 +1,67 @@
+# timeleft
+# Headless core of TimeLeft: profile computation, insights and figure builders.
+#
+# Nothing in this package imports Streamlit, so it can be used from batch jobs
+# or an API. Public names are loaded lazily on first access: `import timeleft`
+# stays cheap and numpy, pandas and Plotly are only imported by the functions
+# that need them.
+
+import importlib
+
+_EXPORTS = {
+    "compute_profile": "timeleft.perfil",
+    "Perfil": "timeleft.perfil",
+    "EntradaPerfil": "timeleft.perfil",
+    "calcular_perfil": "timeleft.perfil",
+    "Etapa": "timeleft.etapas",
+    "etapas_por_defecto": "timeleft.etapas",
+    "generar_insights": "timeleft.insights",
+    "calcular_aniversarios": "timeleft.calendario",
+    "calcular_calendario": "timeleft.calendario",
+    "TablaAniversarios": "timeleft.calendario",
+    "LineaTiempo": "timeleft.linea_tiempo",
+    "semana_de_fecha": "timeleft.linea_tiempo",
+    "etapas_a_tabla": "timeleft.etapas",
+    "tabla_a_etapas": "timeleft.etapas",
+    "normalizar_etapas": "timeleft.etapas",
+    "IndiceHoras": "timeleft.horas",
+    "calcular_semanas": "timeleft.calculations",
+    "calcular_semanas_vectorizado": "timeleft.calculations",
+    "calcular_horas_por_categoria": "timeleft.calculations",
+    "calcular_horas_por_categoria_vectorizado": "timeleft.calculations",
+    "calcular_horas_por_etapa": "timeleft.calculations",
+    "crear_grafico_torta": "timeleft.charts",
+    "crear_grafico_torta_opciones": "timeleft.charts",
+    "crear_grafico_barras": "timeleft.charts",
+    "crear_grafico_barras_acumulado": "timeleft.charts",
+    "crear_grafico_circulos": "timeleft.charts",
+    "crear_grafico_semanas": "timeleft.figuras",
+    "pintar_grilla": "timeleft.grilla",
+    "crear_grilla_png": "timeleft.grilla",
+    "generar_posters": "timeleft.posters",
+    "TablaMortalidad": "timeleft.mortalidad",
+    "cargar_tabla_mortalidad": "timeleft.mortalidad",
+    "esperanza_vida_para_edad": "timeleft.mortalidad",
+    "SimulacionVida": "timeleft.simulacion",
+    "simular_vida": "timeleft.simulacion",
+    "TiempoEsperado": "timeleft.tiempo_esperado",
+    "tiempo_esperado": "timeleft.tiempo_esperado",
+    "Cronometro": "timeleft.depuracion",
+    "EpocaReloj": "timeleft.reloj",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(nombre):
+    """Import the submodule that defines nombre on first access."""
+    modulo = _EXPORTS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module 'timeleft' has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(modulo), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,23 @@
+# arreglos.py
+# This module contains numpy helpers shared by the immutable data structures.
+
+import numpy as np
+
+
+def solo_lectura(valores, dtype=np.int64):
+    """
+    Return a read-only numpy copy of valores.
+
+    Frozen dataclasses holding arrays use it so cached instances cannot be
+    modified in place by their callers.
+
+    Parameters:
+        valores (array-like): The values to copy.
+        dtype (np.dtype): The dtype of the copy.
+
+    Returns:
+        np.ndarray: A non-writeable array.
+    """
+    arreglo = np.array(valores, dtype=dtype)
+    arreglo.flags.writeable = False
+    return arreglo
@@ -0,0 +1,77 @@
+# calculations.py
+# This module contains functions for performing various calculations.
+
+import numpy as np
+
+from timeleft.calendario import a_datetime64
+
+# Stages where working hours are applicable
+ETAPAS_TRABAJO = ("Universidad", "Carrera", "Hasta jubilarte")
+
+def calcular_semanas(fecha_inicio, fecha_fin):
+    """Calculate the number of weeks between two dates."""
+    return max(0, (fecha_fin - fecha_inicio).days // 7)
+
+def calcular_horas_por_categoria(dias_totales, horas_dormir, horas_trabajo):
+    """Calculate hours spent on different categories."""
+    horas_dormidas = dias_totales * horas_dormir
+    horas_trabajadas = dias_totales * horas_trabajo
+    horas_personales = (dias_totales * 24) - (horas_dormidas + horas_trabajadas)
+    return horas_dormidas, horas_trabajadas, horas_personales
+
+def calcular_semanas_vectorizado(fechas_inicio, fechas_fin):
+    """
+    Calculate the number of weeks between pairs of dates.
+
+    Same semantics as calcular_semanas (whole days floored, then whole weeks,
+    never negative) for numpy arrays, pandas Series or lists of dates or
+    datetimes. The time of day is kept until the difference is floored.
+
+    Returns:
+        np.ndarray: Weeks for each pair, as int64.
+    """
+    diferencia = a_datetime64(fechas_fin, "ns") - a_datetime64(fechas_inicio, "ns")
+    dias = diferencia // np.timedelta64(1, "D")
+    return np.maximum(0, dias // 7)
+
+def calcular_horas_por_categoria_vectorizado(dias_totales, horas_dormir, horas_trabajo):
+    """
+    Calculate hours spent on different categories for many rows at once.
+
+    Same semantics as calcular_horas_por_categoria; every argument may be a
+    scalar, a numpy array or a pandas Series and they broadcast together.
+
+    Returns:
+        tuple: (hours sleeping, hours working, hours personal) as numpy arrays.
+    """
+    dias_totales = np.asarray(dias_totales)
+    horas_dormidas = dias_totales * np.asarray(horas_dormir)
+    horas_trabajadas = dias_totales * np.asarray(horas_trabajo)
+    horas_personales = (dias_totales * 24) - (horas_dormidas + horas_trabajadas)
+    return horas_dormidas, horas_trabajadas, horas_personales
+
+def calcular_horas_por_etapa(etapa, semanas_etapa, horas_dormir_por_dia, horas_trabajo_por_dia):
+    """
+    Calculate the hours spent sleeping, working, and on personal time for a specific stage.
+
+    Parameters:
+        etapa (str): The name of the stage.
+        semanas_etapa (int): The number of weeks in the stage.
+        horas_dormir_por_dia (int): Average hours of sleep per day.
+        horas_trabajo_por_dia (int): Average hours of work per day.
+
+    Returns:
+        tuple: (hours sleeping, hours working, hours personal)
+    """
+    dias_etapa = semanas_etapa * 7
+
+    # Calculate working hours only for specific stages
+    if etapa in ETAPAS_TRABAJO:
+        horas_trabajadas = dias_etapa * horas_trabajo_por_dia
+    else:
+        horas_trabajadas = 0
+
+    horas_dormidas = dias_etapa * horas_dormir_por_dia
+    horas_personales = (dias_etapa * 24) - (horas_dormidas + horas_trabajadas)
+
+    return horas_dormidas, horas_trabajadas, horas_personales
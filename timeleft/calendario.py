@@ -0,0 +1,236 @@
+# calendario.py
+# This module contains the vectorized week calendar for life stages.
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from timeleft.config import POLITICA_BISIESTO
+from timeleft.etapas import EDAD_MAXIMA
+from timeleft.linea_tiempo import LineaTiempo
+
+# Dónde cae el cumpleaños de quien nació un 29 de febrero en los años comunes
+POLITICAS_BISIESTO = ("marzo", "febrero")
+
+# Calendario precalculado de aniversarios: años cubiertos y primer día de cada mes
+AÑO_INICIO_GRILLA = 1850
+AÑO_FIN_GRILLA = 2300
+INICIO_MES_BISIESTO = np.cumsum([0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30])
+
+
+def a_datetime64(fechas, unidad="D"):
+    """
+    Convert a date, datetime or array of them to numpy datetime64.
+
+    The default day precision drops the time of day; pass unidad="ns" to keep it.
+    """
+    tipo = f"datetime64[{unidad}]"
+    if isinstance(fechas, np.ndarray) and fechas.dtype.kind == "M":
+        return fechas.astype(tipo)
+    if isinstance(fechas, (pd.Series, pd.Index, np.ndarray, list, tuple)):
+        return pd.to_datetime(np.asarray(fechas)).values.astype(tipo)
+    if unidad == "D":
+        return np.datetime64(pd.Timestamp(fechas).date(), "D")
+    return pd.Timestamp(fechas).to_datetime64().astype(tipo)
+
+
+def calcular_aniversarios(fecha_nacimiento, edades, bisiesto=POLITICA_BISIESTO):
+    """
+    Calculate the birthday anniversaries for a set of ages.
+
+    Parameters:
+        fecha_nacimiento (date or array-like): The birthdate, or an array of
+            birthdates that broadcasts against edades.
+        edades (array-like): Ages in years.
+        bisiesto (str): Where a 29 February birthday falls in common years:
+            "marzo" (1 March) or "febrero" (28 February).
+
+    Returns:
+        np.ndarray: One datetime64[D] per age.
+    """
+    if bisiesto not in POLITICAS_BISIESTO:
+        raise ValueError(f"bisiesto inválido: {bisiesto!r}")
+    nacimiento = a_datetime64(fecha_nacimiento)
+    anio = nacimiento.astype("datetime64[Y]")
+    mes = nacimiento.astype("datetime64[M]") - anio.astype("datetime64[M]")
+    dia = nacimiento - nacimiento.astype("datetime64[M]").astype("datetime64[D]")
+    meses = (anio + np.asarray(edades, dtype=np.int64)).astype("datetime64[M]") + mes
+    aniversarios = meses.astype("datetime64[D]") + dia
+    if bisiesto == "febrero":
+        # Solo un 29 de febrero en año común se pasa de mes: vuelve al 28
+        aniversarios = np.where(aniversarios.astype("datetime64[M]") != meses, aniversarios - 1, aniversarios)
+    return aniversarios
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class TablaAniversarios:
+    """
+    Anniversaries of one or many birthdates, looked up in a precomputed calendar.
+
+    grilla[y, c] is day c of a leap-year calendar (0 is 1 January, 59 is
+    29 February) in year AÑO_INICIO_GRILLA + y, with 29 February of common
+    years resolved by the bisiesto policy. The anniversary at age a of a
+    birthdate is grilla[fila + a, columna]: one integer lookup per date,
+    whatever the number of people. The grid is built once per policy.
+    """
+    nacimientos: np.ndarray
+    filas: np.ndarray
+    columnas: np.ndarray
+    grilla: np.ndarray
+    bisiesto: str = POLITICA_BISIESTO
+
+    @classmethod
+    def desde_nacimientos(cls, fechas_nacimiento, bisiesto=POLITICA_BISIESTO):
+        """
+        Build the table of one birthdate or an array of them.
+
+        Parameters:
+            fechas_nacimiento (date or array-like): The birthdate(s).
+            bisiesto (str): Leap-day policy, see calcular_aniversarios.
+
+        Returns:
+            TablaAniversarios: The table.
+        """
+        if bisiesto not in POLITICAS_BISIESTO:
+            raise ValueError(f"bisiesto inválido: {bisiesto!r}")
+        nacimientos = a_datetime64(fechas_nacimiento)
+        meses = nacimientos.astype("datetime64[M]")
+        dias = (nacimientos - meses.astype("datetime64[D]")).astype(np.int64)
+        meses = meses.astype(np.int64)
+        return cls(
+            nacimientos=nacimientos,
+            filas=meses // 12 + 1970 - AÑO_INICIO_GRILLA,
+            columnas=INICIO_MES_BISIESTO[meses % 12] + dias,
+            grilla=_grilla_aniversarios(bisiesto),
+            bisiesto=bisiesto,
+        )
+
+    def aniversarios(self, edades):
+        """
+        Anniversaries at the given ages.
+
+        Parameters:
+            edades (array-like): Ages in years. For n birthdates they broadcast
+                against (n, 1), e.g. (k,) or (n, k).
+
+        Returns:
+            np.ndarray: datetime64[D] dates. Years outside the grid fall back
+                to calcular_aniversarios.
+        """
+        edades = np.asarray(edades, dtype=np.int64)
+        filas, columnas, nacimientos = self.filas, self.columnas, self.nacimientos
+        if np.ndim(filas):
+            filas, columnas, nacimientos = filas[:, None], columnas[:, None], nacimientos[:, None]
+        años = filas + edades
+        dentro = (años >= 0) & (años < len(self.grilla))
+        fechas = self.grilla[np.where(dentro, años, 0), columnas]
+        if not dentro.all():
+            fechas = np.where(dentro, fechas, calcular_aniversarios(nacimientos, edades, self.bisiesto))
+        return fechas
+
+    def tabla(self, edad_maxima=EDAD_MAXIMA):
+        """
+        Every anniversary from age 0 to edad_maxima.
+
+        Returns:
+            np.ndarray: Shape (edad_maxima + 1,) for one birthdate and
+                (n, edad_maxima + 1) for n of them.
+        """
+        return self.aniversarios(np.arange(edad_maxima + 1))
+
+
+@lru_cache(maxsize=None)
+def _grilla_aniversarios(bisiesto):
+    """Read-only calendar grid of TablaAniversarios for a leap-day policy."""
+    dias_bisiesto = np.datetime64("2000-01-01") + np.arange(366)
+    años = np.arange(AÑO_INICIO_GRILLA, AÑO_FIN_GRILLA) - 2000
+    grilla = calcular_aniversarios(dias_bisiesto[None, :], años[:, None], bisiesto)
+    grilla.flags.writeable = False
+    return grilla
+
+
+def calcular_semanas_etapas(fechas_nacimiento, esperanza_vida, edades_inicio, edades_fin,
+                            bisiesto=POLITICA_BISIESTO, tabla=None):
+    """
+    Calculate the boundaries and weeks of each stage for one or many people at once.
+
+    Stages are clipped to [birth, estimated death] and never have negative weeks.
+
+    Parameters:
+        fechas_nacimiento (date or array-like): Birthdates, n of them.
+        esperanza_vida (int or array-like): Life expectancy in years, scalar or n values.
+        edades_inicio (array-like): Stage start ages, shape (k,) or (n, k).
+        edades_fin (array-like): Stage end ages, shape (k,) or (n, k).
+        bisiesto (str): Leap-day policy, see calcular_aniversarios.
+        tabla (TablaAniversarios): Anniversary table of the n birthdates, if
+            the caller already has one.
+
+    Returns:
+        tuple: (fechas_ini, fechas_fin, semanas), each of shape (n, k).
+    """
+    if tabla is None:
+        tabla = TablaAniversarios.desde_nacimientos(np.atleast_1d(a_datetime64(fechas_nacimiento)), bisiesto)
+    nacimientos = tabla.nacimientos[:, None]
+    fechas_muerte = tabla.aniversarios(np.reshape(esperanza_vida, (-1, 1)))
+
+    fechas_ini = np.maximum(tabla.aniversarios(edades_inicio), nacimientos)
+    fechas_fin = np.minimum(tabla.aniversarios(edades_fin), fechas_muerte)
+    semanas = np.maximum(0, (fechas_fin - fechas_ini).astype(np.int64) // 7)
+    return fechas_ini, fechas_fin, semanas
+
+
+def _normalizar_etapas(etapas_input):
+    """Split stage tuples or dicts into parallel name, start, end and color lists."""
+    nombres, inicios, fines, colores = [], [], [], []
+    for etapa in etapas_input:
+        if isinstance(etapa, dict):
+            etapa = (etapa["nombre"], etapa.get("edad_inicio", 0), etapa["edad_fin"], etapa["color"])
+        nombre, edad_ini, edad_fin, color = etapa
+        nombres.append(nombre)
+        inicios.append(int(edad_ini))
+        fines.append(int(edad_fin))
+        colores.append(color)
+    return nombres, inicios, fines, colores
+
+
+def calcular_calendario(fecha_nacimiento, esperanza_vida, etapas_input, fecha_hoy, bisiesto=POLITICA_BISIESTO):
+    """
+    Calculate stage boundaries, weeks and lived/remaining splits in a single pass.
+
+    Parameters:
+        fecha_nacimiento (date): The birthdate.
+        esperanza_vida (int): Life expectancy in years.
+        etapas_input (list): Stages as (nombre, edad_inicio, edad_fin, color) tuples
+            or dicts with the same keys.
+        fecha_hoy (date): The reference date for weeks lived.
+        bisiesto (str): Leap-day policy, see calcular_aniversarios.
+
+    Returns:
+        pd.DataFrame: One row per stage, indexed by name, with the columns
+            Inicio, Fin, Semana inicio, Semanas, Semanas vividas,
+            Semanas restantes and Color.
+    """
+    nombres, inicios, fines, colores = _normalizar_etapas(etapas_input)
+
+    nacimiento = a_datetime64(fecha_nacimiento)
+    fechas_ini, fechas_fin, semanas = calcular_semanas_etapas(nacimiento, int(esperanza_vida), inicios, fines, bisiesto)
+    fechas_ini, fechas_fin, semanas = fechas_ini[0], fechas_fin[0], semanas[0]
+
+    semanas_vividas = (a_datetime64(fecha_hoy) - nacimiento).astype(np.int64) // 7
+    linea = LineaTiempo.desde_semanas(nombres, colores, semanas)
+    vividas, restantes = linea.dividir(semanas_vividas)
+
+    return pd.DataFrame(
+        {
+            "Inicio": fechas_ini,
+            "Fin": fechas_fin,
+            "Semana inicio": linea.inicios,
+            "Semanas": semanas,
+            "Semanas vividas": vividas,
+            "Semanas restantes": restantes,
+            "Color": colores,
+        },
+        index=pd.Index(nombres),
+    )
@@ -0,0 +1,196 @@
+# charts.py
+# This module contains functions for creating various charts.
+
+import numpy as np
+import plotly.graph_objects as go
+
+from timeleft.config import CIRCULOS_UMBRAL_WEBGL
+
+def crear_grafico_torta(labels, values, titulo):
+    """Create a pie chart."""
+    fig = go.Figure()
+    fig.add_trace(go.Pie(labels=labels, values=values, hole=0.4))
+    fig.update_layout(title=titulo)
+    return fig
+
+def crear_grafico_torta_opciones(labels, opciones, etiqueta_menu=""):
+    """
+    Create a pie chart whose values and title switch in the browser.
+
+    Every option is embedded in the figure and a dropdown (Plotly updatemenus)
+    swaps the values and the title client-side, without a server round-trip.
+
+    Parameters:
+        labels (list): The slice labels, shared by every option.
+        opciones (dict): Option name -> (values, title). The first one is shown.
+        etiqueta_menu (str): Text shown next to the dropdown.
+
+    Returns:
+        go.Figure: The pie chart with the dropdown.
+    """
+    valores_iniciales, titulo_inicial = next(iter(opciones.values()))
+    fig = crear_grafico_torta(labels, valores_iniciales, titulo_inicial)
+    botones = [
+        dict(
+            label=opcion,
+            method="update",
+            args=[{"values": [np.asarray(valores).tolist()]}, {"title.text": titulo}],
+        )
+        for opcion, (valores, titulo) in opciones.items()
+    ]
+    fig.update_layout(
+        updatemenus=[dict(buttons=botones, direction="down", x=1, xanchor="right", y=1.12, yanchor="top")],
+        annotations=[
+            dict(text=etiqueta_menu, x=1, xref="paper", xanchor="right", y=1.2, yref="paper", yanchor="bottom", showarrow=False)
+        ] if etiqueta_menu else [],
+        margin=dict(t=120),
+    )
+    return fig
+
+def crear_grafico_barras(etapas, colores, semanas_vividas):
+    """Create a bar chart."""
+    fig = go.Figure()
+    for etapa, color in zip(etapas.keys(), colores):
+        semanas = etapas[etapa]
+        fig.add_trace(go.Bar(
+            y=[""],
+            x=[semanas],
+            name=etapa,
+            orientation='h',
+            marker=dict(color=color)
+        ))
+    fig.update_layout(barmode='stack', title="Etapas de la vida")
+    return fig
+
+def crear_grafico_barras_acumulado(etapas, colores, semanas_vividas, semanas_hasta_jubilarse=None, semanas_post_jubilacion=None):
+    """Create a stacked bar chart of the stages with the current week marked."""
+    fig = go.Figure()
+    for etapa, color in zip(etapas.keys(), colores.values()):
+        semanas = etapas[etapa]
+        fig.add_trace(go.Bar(
+            y=[""],
+            x=[semanas],
+            name=etapa,
+            orientation='h',
+            marker=dict(color=color),
+            hovertemplate=(
+                f"<b>{etapa}</b><br>Semanas vividas: {semanas}<extra></extra>"
+            )
+        ))
+
+    # Agregar marcador para la semana actual
+    fig.add_trace(go.Scatter(
+        y=[""],
+        x=[semanas_vividas],
+        mode="markers",
+        marker=dict(size=12, color="red", symbol="diamond"),
+        name="Semana actual",
+        hovertemplate=f"<b>Semana actual</b><br>Semanas vividas: {semanas_vividas}<extra></extra>"
+    ))
+
+    # Agregar barras adicionales si existen
+    if semanas_hasta_jubilarse:
+        fig.add_trace(go.Bar(
+            y=[""],
+            x=[semanas_hasta_jubilarse],
+            name="Hasta jubilarte",
+            orientation='h',
+            marker=dict(color=colores.get("Hasta jubilarte"), opacity=0.5),
+            hovertemplate=(
+                f"<b>Hasta jubilarte restante</b><br>Semanas restantes: {semanas_hasta_jubilarse}<extra></extra>"
+            )
+        ))
+
+    if semanas_post_jubilacion:
+        fig.add_trace(go.Bar(
+            y=[""],
+            x=[semanas_post_jubilacion],
+            name="Post jubilación restante",
+            orientation='h',
+            marker=dict(color=colores.get("Jubilación"), opacity=0.5),
+            hovertemplate=(
+                f"<b>Post jubilación restante</b><br>Semanas restantes: {semanas_post_jubilacion}<extra></extra>"
+            )
+        ))
+
+    fig.update_layout(
+        barmode='stack',
+        xaxis_title='Fines de semanas vividos',
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="left",
+            x=0
+        ),
+        height=200
+    )
+    return fig
+
+def _enteros_compactos(valores):
+    """Return non-negative integer coordinates in the smallest dtype that holds them."""
+    valores = np.asarray(valores)
+    return valores.astype(np.min_scalar_type(int(valores.max()) if len(valores) else 0))
+
+def escala_colores_discreta(colores):
+    """Build a stepped colorscale where integer code k maps to colores[k] (with cmin=-0.5, cmax=n-0.5)."""
+    n = len(colores)
+    escala = []
+    for k, color in enumerate(colores):
+        escala.append([k / n, color])
+        escala.append([(k + 1) / n, color])
+    return escala
+
+def crear_grafico_circulos(x, y, codigos, colores, current_week_index, nombre, render_mode="auto", umbral_webgl=CIRCULOS_UMBRAL_WEBGL,
+                           supervivencia=None):
+    """
+    Create the life-in-weeks circle chart, highlighting the current week.
+
+    Each week is encoded by an integer stage code (an index into colores) and
+    painted through a discrete colorscale; hover labels come from a
+    hovertemplate over the week numbers in customdata, so the figure does not
+    carry a color string and a label per point.
+
+    render_mode selects the trace type: "svg" (go.Scatter), "webgl" (go.Scattergl)
+    or "auto", which uses WebGL when there are more than umbral_webgl points.
+
+    supervivencia, one probability per week, fades each week in proportion
+    to the chance of living it.
+    """
+    if render_mode not in ("auto", "svg", "webgl"):
+        raise ValueError(f"render_mode inválido: {render_mode!r}")
+    usar_webgl = render_mode == "webgl" or (render_mode == "auto" and len(x) > umbral_webgl)
+    traza = go.Scattergl if usar_webgl else go.Scatter
+
+    # Highlight the current week with an extra red code
+    paleta = list(colores) + ["#FF0000"]
+    codigos = np.array(codigos, dtype=np.min_scalar_type(len(paleta)))
+    if 0 <= current_week_index < len(codigos):
+        codigos[current_week_index] = len(paleta) - 1
+
+    fig = go.Figure()
+    fig.add_trace(traza(
+        x=_enteros_compactos(x),
+        y=_enteros_compactos(y),
+        mode='markers',
+        marker=dict(
+            size=6,
+            color=codigos,
+            colorscale=escala_colores_discreta(paleta),
+            cmin=-0.5,
+            cmax=len(paleta) - 0.5,
+            opacity=0.8 if supervivencia is None else (0.05 + 0.75 * np.asarray(supervivencia)).astype(np.float32)
+        ),
+        customdata=np.arange(1, len(x) + 1, dtype=np.min_scalar_type(len(x))),
+        hovertemplate="Semana %{customdata}<extra></extra>"
+    ))
+    # Update layout to reduce margins and maximize space
+    fig.update_layout(
+        title=f"Semanas de vida de {nombre}",
+        xaxis=dict(showgrid=False, zeroline=False, visible=False),
+        yaxis=dict(showgrid=False, zeroline=False, visible=False, autorange="reversed"),
+        margin=dict(l=0, r=0, t=30, b=0),
+        showlegend=False
+    )
+    return fig
@@ -0,0 +1,45 @@
+# config.py
+# This module contains default configurations and constants.
+
+ESPERANZA_VIDA_DEFAULT = 76
+EDAD_JUBILACION_DEFAULT = 65
+HORAS_DORMIR_DEFAULT = 7
+HORAS_TRABAJO_DEFAULT = 8
+
+ETAPAS_DEFAULT = [
+    {"nombre": "De nacimiento a conciencia", "edad_inicio": 0, "edad_fin": 5, "color": "#FFD700"},
+    {"nombre": "Infancia consciente", "edad_inicio": 5, "edad_fin": 18, "color": "#87CEEB"},
+    {"nombre": "Universidad y soltería", "edad_inicio": 18, "edad_fin": 24, "color": "#32CD32"},
+    {"nombre": "Carrera y noviazgo", "edad_inicio": 24, "edad_fin": 37, "color": "#FF8C00"},
+    {"nombre": "Hasta jubilarte", "edad_inicio": 37, "edad_fin": 65, "color": "#FFA07A"},
+    {"nombre": "Jubilación", "edad_inicio": 65, "edad_fin": 76, "color": "#F8F8FF"}
+]
+
+# Caché del perfil calculado (st.cache_data)
+PERFIL_CACHE_MAX_ENTRIES = 256
+PERFIL_CACHE_TTL = 6 * 60 * 60  # segundos
+
+# Cantidad de puntos a partir de la cual el gráfico de círculos usa WebGL
+CIRCULOS_UMBRAL_WEBGL = 3000
+
+# Normalización de etapas: relleno de huecos y caché por contenido
+ETAPA_RELLENO_NOMBRE = "Sin etapa"
+ETAPA_RELLENO_COLOR = "#808080"
+NORMALIZADOR_CACHE_MAX_ENTRIES = 256
+
+# Figuras que solo dependen de la semana de vida (barras y círculos)
+FIGURAS_SEMANA_CACHE_MAX_ENTRIES = 64
+
+# Aniversarios: 29 de febrero en años comunes ("marzo" = 1 de marzo, "febrero" = 28 de febrero)
+POLITICA_BISIESTO = "marzo"
+
+# Tablas de mortalidad: consultas de esperanza de vida condicional cacheadas
+MORTALIDAD_CACHE_MAX_ENTRIES = 1024
+
+# Simulación Monte Carlo de la duración de vida: muestras, caché y presupuesto de tiempo
+SIMULACION_MUESTRAS = 100_000
+SIMULACION_CACHE_MAX_ENTRIES = 32
+SIMULACION_PRESUPUESTO_MS = 50
+
+# Horas de lectura por libro (tiempo personal)
+HORAS_POR_LIBRO = 8
@@ -0,0 +1,94 @@
+# depuracion.py
+# This module contains the rerun instrumentation behind the ?debug=1 panel.
+
+import json
+import time
+
+
+def tamaño_payload(objeto):
+    """
+    Estimate the serialized size in bytes of an element sent to the browser.
+
+    Parameters:
+        objeto: A Plotly figure (anything with to_json), bytes, a string or a
+            JSON-serializable value.
+
+    Returns:
+        int: Size in bytes.
+    """
+    if hasattr(objeto, "to_json"):
+        objeto = objeto.to_json()
+    if isinstance(objeto, (bytes, bytearray)):
+        return len(objeto)
+    if not isinstance(objeto, str):
+        objeto = json.dumps(objeto, default=str)
+    return len(objeto.encode("utf-8"))
+
+
+class Cronometro:
+    """
+    Lap timer for the sections of one script run.
+
+    marcar(seccion) closes the section that started at the previous mark (or at
+    creation), so instrumenting a script only needs one call after each block.
+    Payload sizes are only computed when activo is True, since serializing the
+    figures has a cost of its own.
+    """
+
+    def __init__(self, activo=False):
+        self.activo = activo
+        self.inicio = time.perf_counter()
+        self._ultima_marca = self.inicio
+        self.secciones = []
+        self.cerrado = False
+
+    def cerrar(self):
+        """
+        Mark the end of the script run.
+
+        A st.fragment can rerun on its own afterwards, still seeing this timer;
+        its sections then go to the timer of para_fragmento().
+        """
+        self.cerrado = True
+
+    def para_fragmento(self):
+        """
+        Timer for the sections of a st.fragment.
+
+        Returns:
+            Cronometro: self during the full script run, or a new timer with
+                the same activo when the fragment reruns on its own.
+        """
+        return Cronometro(self.activo) if self.cerrado else self
+
+    def marcar(self, seccion, *elementos):
+        """
+        Record the time since the previous mark under seccion.
+
+        Parameters:
+            seccion (str): Name of the block that just finished.
+            *elementos: Elements the block sent to the browser, measured with
+                tamaño_payload when the timer is active.
+        """
+        ahora = time.perf_counter()
+        payload = sum(tamaño_payload(elemento) for elemento in elementos) if self.activo and elementos else None
+        self.secciones.append((seccion, (ahora - self._ultima_marca) * 1000, payload))
+        # El tiempo de medir el payload no se le cobra a la sección siguiente
+        self._ultima_marca = time.perf_counter()
+
+    def tabla(self):
+        """
+        Breakdown of the recorded sections.
+
+        Returns:
+            pd.DataFrame: One row per section with the columns ms, % and
+                Payload (bytes), plus a Total row.
+        """
+        import pandas as pd
+
+        tabla = pd.DataFrame(self.secciones, columns=["Sección", "ms", "Payload (bytes)"]).set_index("Sección")
+        total = tabla["ms"].sum()
+        tabla["%"] = (tabla["ms"] / total * 100 if total else 0.0)
+        tabla.loc["Total"] = [total, tabla["Payload (bytes)"].sum(min_count=1), 100.0]
+        tabla["Payload (bytes)"] = tabla["Payload (bytes)"].astype("Int64")
+        return tabla[["ms", "%", "Payload (bytes)"]].round({"ms": 1, "%": 1})
@@ -0,0 +1,173 @@
+# etapas.py
+# This module contains the conversion, validation and normalization of life stages.
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from timeleft.config import ETAPA_RELLENO_COLOR, ETAPA_RELLENO_NOMBRE, NORMALIZADOR_CACHE_MAX_ENTRIES
+
+COLUMNAS_ETAPAS = ["Etapa", "Edad inicio", "Edad fin", "Color"]
+EDAD_MAXIMA = 120
+PATRON_COLOR = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+
+@dataclass(frozen=True, slots=True)
+class Etapa:
+    """
+    Immutable life stage, usable as a cache key.
+
+    It unpacks like a (nombre, edad_inicio, edad_fin, color) tuple, so it can
+    be passed anywhere stage tuples are accepted.
+    """
+    nombre: str
+    edad_inicio: int
+    edad_fin: int
+    color: str
+
+    @classmethod
+    def desde(cls, etapa):
+        """Build an Etapa from another Etapa, a stage tuple or a stage dict."""
+        if isinstance(etapa, cls):
+            return etapa
+        if isinstance(etapa, dict):
+            etapa = (etapa["nombre"], etapa.get("edad_inicio", 0), etapa["edad_fin"], etapa["color"])
+        nombre, edad_inicio, edad_fin, color = etapa
+        return cls(str(nombre), int(edad_inicio), int(edad_fin), str(color))
+
+    def __iter__(self):
+        return iter((self.nombre, self.edad_inicio, self.edad_fin, self.color))
+
+
+def etapas_por_defecto(edad_jubilacion, esperanza_vida):
+    """
+    Return the built-in stage tuples for a retirement age and life expectancy.
+
+    Both arguments may also be arrays (one value per person); the ages in the
+    tuples are then arrays too.
+    """
+    return (
+        ("De nacimiento a conciencia", 0, 5, "#FFD700"),
+        ("Infancia consciente", 5, 18, "#87CEEB"),
+        ("Universidad", 18, 24, "#32CD32"),
+        ("Carrera", 24, np.minimum(edad_jubilacion, 37), "#FF8C00"),
+        ("Hasta jubilarte", 37, edad_jubilacion, "#FFA07A"),
+        ("Jubilación", edad_jubilacion, esperanza_vida, "#F8F8FF"),
+    )
+
+
+def etapas_a_tabla(etapas):
+    """
+    Convert stages to the table shown in the stage editor.
+
+    Parameters:
+        etapas (iterable): Etapa objects, stage tuples or stage dicts.
+
+    Returns:
+        pd.DataFrame: One row per stage with COLUMNAS_ETAPAS.
+    """
+    return pd.DataFrame([tuple(Etapa.desde(etapa)) for etapa in etapas], columns=COLUMNAS_ETAPAS)
+
+
+def tabla_a_etapas(tabla):
+    """
+    Validate an edited stage table and convert it back to stage dicts.
+
+    Rows keep the table order and fully empty rows are ignored; the timeline
+    is ordered by start age later, by normalizar_etapas. The whole table is checked at once, so the
+    caller gets every problem of a batch of edits together.
+
+    Parameters:
+        tabla (pd.DataFrame): The edited table, with COLUMNAS_ETAPAS.
+
+    Returns:
+        tuple: (etapas, errores). etapas is a tuple of Etapa, or None when
+            errores (a list of messages) is not empty.
+    """
+    tabla = tabla.dropna(how="all", subset=COLUMNAS_ETAPAS)
+
+    etapas, errores, nombres = [], [], set()
+    for numero, fila in enumerate(tabla.to_dict("records"), start=1):
+        nombre = "" if pd.isna(fila["Etapa"]) else str(fila["Etapa"]).strip()
+        edad_inicio = pd.to_numeric(fila["Edad inicio"], errors="coerce")
+        edad_fin = pd.to_numeric(fila["Edad fin"], errors="coerce")
+        color = "" if pd.isna(fila["Color"]) else str(fila["Color"]).strip()
+
+        if not nombre:
+            errores.append(f"Fila {numero}: falta el nombre de la etapa.")
+        elif nombre in nombres:
+            errores.append(f"Fila {numero}: la etapa '{nombre}' está repetida.")
+        nombres.add(nombre)
+        if pd.isna(edad_inicio) or pd.isna(edad_fin):
+            errores.append(f"Fila {numero}: faltan las edades de inicio o fin.")
+        elif not 0 <= edad_inicio <= edad_fin <= EDAD_MAXIMA:
+            errores.append(f"Fila {numero}: las edades deben cumplir 0 ≤ inicio ≤ fin ≤ {EDAD_MAXIMA}.")
+        if not PATRON_COLOR.match(color):
+            errores.append(f"Fila {numero}: el color debe tener el formato #RRGGBB.")
+
+        if not errores:
+            etapas.append(Etapa(nombre, int(edad_inicio), int(edad_fin), color))
+
+    if not etapas and not errores:
+        errores.append("Tiene que haber al menos una etapa.")
+    return (None, errores) if errores else (tuple(etapas), [])
+
+
+def normalizar_etapas(etapas, esperanza_vida):
+    """
+    Turn any list of stages into a canonical, contiguous timeline from 0 to esperanza_vida.
+
+    Stages are clipped to [0, esperanza_vida] and sorted by start age (ties
+    keep their input order). Each stage then starts where the ones before it
+    end, so overlapping weeks are never counted twice; stages fully covered
+    by earlier ones, or empty, are dropped. Gaps are filled with
+    ETAPA_RELLENO_NOMBRE stages named after their age range. The work is
+    O(n log n) and results are cached by the stages' content.
+
+    Parameters:
+        etapas (iterable): Stages as (nombre, edad_inicio, edad_fin, color)
+            tuples or dicts with the same keys.
+        esperanza_vida (int): Life expectancy in years.
+
+    Returns:
+        tuple: Etapa objects, contiguous and ordered by age.
+    """
+    return _normalizar_cacheado(tuple(Etapa.desde(etapa) for etapa in etapas), int(esperanza_vida))
+
+
+@lru_cache(maxsize=NORMALIZADOR_CACHE_MAX_ENTRIES)
+def _normalizar_cacheado(etapas, esperanza_vida):
+    """normalizar_etapas over a tuple of Etapa, which is hashable."""
+    inicios = np.clip(np.array([etapa.edad_inicio for etapa in etapas], dtype=np.int64), 0, esperanza_vida)
+    fines = np.clip(np.array([etapa.edad_fin for etapa in etapas], dtype=np.int64), 0, esperanza_vida)
+
+    # Solo etapas no vacías, ordenadas por inicio (estable ante empates)
+    indices = np.flatnonzero(fines > inicios)
+    indices = indices[np.argsort(inicios[indices], kind="stable")]
+    inicios, fines = inicios[indices], fines[indices]
+
+    # Cobertura acumulada: cada etapa arranca donde termina lo anterior
+    cubierto = np.concatenate(([0], np.maximum.accumulate(fines)))
+    desde = np.maximum(inicios, cubierto[:-1])
+    visibles = fines > desde
+    huecos = inicios > cubierto[:-1]
+
+    normalizadas = []
+    for indice, inicio, fin, previo, visible, hueco in zip(
+        indices.tolist(), desde.tolist(), fines.tolist(), cubierto[:-1].tolist(), visibles, huecos
+    ):
+        if hueco:
+            normalizadas.append(_etapa_relleno(previo, inicio))
+        if visible:
+            normalizadas.append(Etapa(etapas[indice].nombre, inicio, fin, etapas[indice].color))
+    if cubierto[-1] < esperanza_vida:
+        normalizadas.append(_etapa_relleno(int(cubierto[-1]), esperanza_vida))
+    return tuple(normalizadas)
+
+
+def _etapa_relleno(edad_inicio, edad_fin):
+    """Filler stage for the uncovered ages [edad_inicio, edad_fin)."""
+    return Etapa(f"{ETAPA_RELLENO_NOMBRE} ({edad_inicio}-{edad_fin})", edad_inicio, edad_fin, ETAPA_RELLENO_COLOR)
@@ -0,0 +1,125 @@
+# figuras.py
+# This module contains the Plotly figures of a computed profile.
+#
+# It is only imported when a figure is first needed (see Perfil.figuras), so
+# the profile computation itself does not load Plotly.
+
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+
+from timeleft.charts import (
+    crear_grafico_barras_acumulado,
+    crear_grafico_circulos,
+    crear_grafico_torta,
+    crear_grafico_torta_opciones,
+)
+from timeleft.config import FIGURAS_SEMANA_CACHE_MAX_ENTRIES
+from timeleft.horas import CATEGORIAS_HORAS
+from timeleft.linea_tiempo import LineaTiempo
+
+
+def crear_figuras_perfil(perfil):
+    """
+    Build every figure of the dashboard for a profile.
+
+    Parameters:
+        perfil (Perfil): The computed profile.
+
+    Returns:
+        dict: fig_barras, fig_circulos, fig_distribucion and fig_tiempo_restante.
+    """
+    calendario = perfil.calendario
+    linea_tiempo = perfil.linea_tiempo
+
+    # Las figuras por semana solo cambian con la semana de vida: se reutilizan entre días
+    fig_barras, fig_circulos = _figuras_semanales(
+        tuple(calendario.index),
+        tuple(calendario["Color"]),
+        tuple(int(semanas) for semanas in calendario["Semanas"]),
+        perfil.semanas_totales,
+        perfil.semanas_vividas,
+        perfil.nombre,
+    )
+
+    # Torta de distribución: el total y cada etapa, elegibles en el navegador, todos del mismo índice
+    indice_horas = perfil.indice_horas
+    opciones_distribucion = {
+        "Total": (
+            indice_horas.horas(0, indice_horas.total_semanas),
+            "Distribución del tiempo: Durmiendo, Trabajando y Tiempo Personal",
+        )
+    }
+    for etapa, horas_etapa in zip(linea_tiempo.nombres, indice_horas.horas_por_etapa(linea_tiempo)):
+        opciones_distribucion[etapa] = (horas_etapa, f"Distribución del tiempo relativo a la etapa: {etapa}")
+    fig_distribucion = crear_grafico_torta_opciones(
+        list(CATEGORIAS_HORAS),
+        opciones_distribucion,
+        "Selecciona una etapa para ver los valores relativos:",
+    )
+    fig_tiempo_restante = crear_grafico_torta(
+        ["Trabajo futuro", "Tiempo personal restante"],
+        [perfil.horas_trabajo_futuro, perfil.horas_personales_restantes],
+        "Distribución del tiempo restante: Trabajo futuro y Tiempo Personal"
+    )
+
+    return {
+        "fig_barras": fig_barras,
+        "fig_circulos": fig_circulos,
+        "fig_distribucion": fig_distribucion,
+        "fig_tiempo_restante": fig_tiempo_restante,
+    }
+
+
+def _figuras_semanales(nombres, colores, semanas, semanas_totales, semanas_vividas, nombre):
+    """
+    Bar and circle figures of a profile, keyed by the week of life.
+
+    Every argument is constant for a whole week, so the figures of the other
+    days of that week are rebuilt from the cached figure dicts instead of
+    recomputed. Each call returns new Figure objects that the caller may
+    modify freely.
+
+    Returns:
+        tuple: (fig_barras, fig_circulos).
+    """
+    # Los dicts vienen de figuras ya validadas: reconstruirlas sin validar cuesta poco
+    return tuple(
+        go.Figure(figura, _validate=False)
+        for figura in _figuras_semanales_cacheadas(nombres, colores, semanas, semanas_totales, semanas_vividas, nombre)
+    )
+
+
+@lru_cache(maxsize=FIGURAS_SEMANA_CACHE_MAX_ENTRIES)
+def _figuras_semanales_cacheadas(nombres, colores, semanas, semanas_totales, semanas_vividas, nombre):
+    """Dicts of the figures of _figuras_semanales, shared by every caller."""
+    fig_barras = crear_grafico_barras_acumulado(dict(zip(nombres, semanas)), dict(zip(nombres, colores)), semanas_vividas)
+
+    linea_tiempo = LineaTiempo.desde_semanas(nombres, colores, semanas)
+    fig_circulos = crear_grafico_semanas(linea_tiempo, semanas_totales, semanas_vividas, nombre)
+    return fig_barras.to_dict(), fig_circulos.to_dict()
+
+
+def crear_grafico_semanas(linea_tiempo, semanas_totales, semanas_vividas, nombre, supervivencia=None):
+    """
+    Circle chart of every week of life, 52 per row.
+
+    Parameters:
+        linea_tiempo (LineaTiempo): The stage timeline.
+        semanas_totales (int): Weeks in the grid.
+        semanas_vividas (int): Weeks lived; the current week is highlighted.
+        nombre (str): The person's name, for the title.
+        supervivencia (array-like): Optional probability of living each week,
+            which fades the weeks (see crear_grafico_circulos).
+
+    Returns:
+        go.Figure: The chart.
+    """
+    cols = 52
+    rows = semanas_totales // cols + 1
+    x = np.tile(np.arange(cols), rows)[:semanas_totales]
+    y = np.repeat(np.arange(rows), cols)[:semanas_totales]
+    return crear_grafico_circulos(
+        x, y, linea_tiempo.expandir(), linea_tiempo.colores, semanas_vividas - 1, nombre, supervivencia=supervivencia
+    )
@@ -0,0 +1,64 @@
+# grilla.py
+# This module paints the life-in-weeks grid as a raster image.
+
+import io
+
+import numpy as np
+
+COLOR_SEMANA_ACTUAL = "#FF0000"
+COLOR_FONDO = "#0E1117"
+
+
+def hex_a_rgb(colores):
+    """Convert a sequence of '#RRGGBB' strings to an (n, 3) uint8 array."""
+    enteros = np.array([int(c.lstrip("#"), 16) for c in colores], dtype=np.uint32)
+    return np.stack([(enteros >> 16) & 0xFF, (enteros >> 8) & 0xFF, enteros & 0xFF], axis=-1).astype(np.uint8)
+
+
+def pintar_grilla(colores, semanas, semanas_vividas, cols=52, tamaño_bloque=8, separacion=2, supervivencia=None):
+    """
+    Paint the week grid into an RGB array, one square block per week.
+
+    Parameters:
+        colores (sequence): Hex color of each stage.
+        semanas (sequence): Number of weeks of each stage.
+        semanas_vividas (int): Weeks lived; that week is painted red.
+        cols (int): Weeks per row.
+        tamaño_bloque (int): Side of each week block in pixels.
+        separacion (int): Gap between blocks in pixels.
+        supervivencia (array-like): Optional probability of living each week;
+            weeks are blended into the background in proportion to it.
+
+    Returns:
+        np.ndarray: A (height, width, 3) uint8 image.
+    """
+    semanas = np.asarray(semanas, dtype=np.int64)
+    total = int(semanas.sum())
+    rows = max(1, -(-total // cols))
+    fondo = hex_a_rgb([COLOR_FONDO])[0]
+
+    paleta = hex_a_rgb(colores) if len(colores) else np.empty((0, 3), dtype=np.uint8)
+    celdas = np.empty((rows * cols, 3), dtype=np.uint8)
+    celdas[:] = fondo
+    celdas[:total] = np.repeat(paleta, semanas, axis=0)
+    if supervivencia is not None:
+        peso = np.asarray(supervivencia, dtype=np.float64)[:total, None]
+        celdas[:total] = np.rint(fondo + (celdas[:total] - fondo.astype(np.float64)) * peso).astype(np.uint8)
+    if 0 < semanas_vividas <= total:
+        celdas[semanas_vividas - 1] = hex_a_rgb([COLOR_SEMANA_ACTUAL])[0]
+
+    paso = tamaño_bloque + separacion
+    lienzo = np.empty((rows, paso, cols, paso, 3), dtype=np.uint8)
+    lienzo[:] = fondo
+    lienzo[:, :tamaño_bloque, :, :tamaño_bloque] = celdas.reshape(rows, 1, cols, 1, 3)
+    return lienzo.reshape(rows * paso, cols * paso, 3)
+
+
+def crear_grilla_png(colores, semanas, semanas_vividas, cols=52, tamaño_bloque=8, separacion=2, supervivencia=None):
+    """Paint the week grid and return it encoded as PNG bytes."""
+    from PIL import Image  # Solo hace falta para codificar, no para pintar
+
+    imagen = pintar_grilla(colores, semanas, semanas_vividas, cols, tamaño_bloque, separacion, supervivencia)
+    buffer = io.BytesIO()
+    Image.fromarray(imagen).save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
@@ -0,0 +1,92 @@
+# horas.py
+# This module contains the prefix-sum index of hours per week of life.
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from timeleft.arreglos import solo_lectura
+from timeleft.calculations import ETAPAS_TRABAJO
+
+CATEGORIAS_HORAS = ("Durmiendo", "Trabajando", "Tiempo personal")
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class IndiceHoras:
+    """
+    Cumulative hours of sleep, work and personal time over the weeks of a life.
+
+    acumuladas[c, s] holds the hours of category c (in CATEGORIAS_HORAS order)
+    in weeks [0, s), so the hours between any two weeks are a difference of
+    two entries: O(1) per query, whatever the stage, year or custom range.
+    """
+    acumuladas: np.ndarray
+
+    @classmethod
+    def desde_linea_tiempo(cls, linea_tiempo, horas_dormir_por_dia, horas_trabajo_por_dia,
+                           etapas_trabajo=ETAPAS_TRABAJO):
+        """
+        Build the index from a LineaTiempo.
+
+        Parameters:
+            linea_tiempo (LineaTiempo): The stage timeline.
+            horas_dormir_por_dia (int): Average hours of sleep per day.
+            horas_trabajo_por_dia (int): Average hours of work per day, only
+                counted in the stages of etapas_trabajo.
+            etapas_trabajo (tuple): Names of the stages with working hours.
+
+        Returns:
+            IndiceHoras: The index over linea_tiempo.total_semanas weeks.
+        """
+        # Horas por semana de cada etapa, luego repetidas semana a semana
+        trabaja = np.isin(np.asarray(linea_tiempo.nombres, dtype=object), etapas_trabajo)
+        dormidas = np.full(len(linea_tiempo.nombres), 7 * horas_dormir_por_dia, dtype=np.int64)
+        trabajadas = np.where(trabaja, 7 * horas_trabajo_por_dia, 0).astype(np.int64)
+        por_etapa = np.stack([dormidas, trabajadas, 7 * 24 - (dormidas + trabajadas)])
+
+        por_semana = por_etapa[:, linea_tiempo.expandir()]
+        acumuladas = np.zeros((len(CATEGORIAS_HORAS), por_semana.shape[1] + 1), dtype=np.int64)
+        np.cumsum(por_semana, axis=1, out=acumuladas[:, 1:])
+        return cls(acumuladas=solo_lectura(acumuladas))
+
+    @property
+    def total_semanas(self):
+        """Number of weeks covered by the index."""
+        return self.acumuladas.shape[1] - 1
+
+    def horas(self, desde, hasta):
+        """
+        Hours of each category in the weeks [desde, hasta).
+
+        Bounds are clipped to the timeline and may be arrays, which broadcast
+        together.
+
+        Returns:
+            np.ndarray: Shape (3,) for scalar bounds, (3, ...) otherwise.
+        """
+        desde = np.clip(desde, 0, self.total_semanas)
+        hasta = np.clip(hasta, desde, self.total_semanas)
+        return self.acumuladas[:, hasta] - self.acumuladas[:, desde]
+
+    def horas_entre_limites(self, limites):
+        """
+        Hours of each category between consecutive week limits.
+
+        Parameters:
+            limites (array-like): Ascending week limits, e.g. the weeks of each
+                birthday for hours per year or per decade.
+
+        Returns:
+            np.ndarray: Shape (len(limites) - 1, 3), one row per interval.
+        """
+        limites = np.asarray(limites)
+        return self.horas(limites[:-1], limites[1:]).T
+
+    def horas_por_etapa(self, linea_tiempo):
+        """
+        Hours of each category in every run of linea_tiempo.
+
+        Returns:
+            np.ndarray: Shape (runs, 3), one row per run.
+        """
+        return self.horas(linea_tiempo.inicios, linea_tiempo.fines).T
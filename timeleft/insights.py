@@ -0,0 +1,27 @@
+# insights.py
+# This module contains the personalized insight texts of the dashboard.
+
+
+def generar_insights(porcentaje_vivido, años_restantes, semanas_vividas, semanas_restantes, dias_vividos):
+    """
+    Build the dynamic insight sentences shown in the dashboard.
+
+    Parameters:
+        porcentaje_vivido (float): Percentage of the expected life already lived.
+        años_restantes (int): Years left until the estimated death date.
+        semanas_vividas (int): Weeks lived.
+        semanas_restantes (int): Weeks left.
+        dias_vividos (int): Days lived.
+
+    Returns:
+        tuple: The insight sentences, in display order.
+    """
+    return (
+        f"🌟 Ya viviste el {porcentaje_vivido:.2f}% de tu vida. Aún te quedan {años_restantes} años llenos de potencial.",
+        f"🎨 Cada punto en tu gráfico es una semana: una historia, una oportunidad. ¿Cómo vas a pintar las siguientes {semanas_restantes} semanas?",
+        f"⌛ Si te quedan {semanas_restantes} semanas, ¿cuántas dedicarás a lo verdaderamente importante?",
+        f"📅 Viviste más de {dias_vividos} días desde que naciste.",
+        f"🌕 Sobreviviste a unas {dias_vividos // 29} lunas llenas.",
+        f"😴 Estuviste despierto unos {(dias_vividos * 16) // 24} días completos (si dormiste 8 hs por día).",
+        f"🍃 Disfrutaste al menos {semanas_vividas // 1} fines de semana: más de {semanas_vividas * 2} días de descanso."
+    )
@@ -0,0 +1,109 @@
+# linea_tiempo.py
+# This module contains the run-length representation of the life timeline.
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from timeleft.arreglos import solo_lectura
+
+
+def _escalar_o_arreglo(resultado, entrada):
+    """Return a Python int for scalar input and the array otherwise."""
+    return int(resultado) if np.ndim(entrada) == 0 else resultado
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class LineaTiempo:
+    """
+    Life timeline stored as contiguous runs of weeks.
+
+    Run i starts at week inicios[i], lasts longitudes[i] weeks and belongs to
+    stage ids[i], whose name and color are nombres[ids[i]] and colores[ids[i]].
+    Range queries cost O(runs) and point lookups O(log runs) through a
+    binary search over the cumulative run ends; per-week arrays are only
+    built by expandir().
+    """
+    nombres: tuple
+    colores: tuple
+    inicios: np.ndarray
+    longitudes: np.ndarray
+    ids: np.ndarray
+    fines: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Índice de límites acumulados: semana donde termina cada tramo (exclusivo)
+        object.__setattr__(self, "fines", solo_lectura(self.inicios + self.longitudes))
+
+    @classmethod
+    def desde_semanas(cls, nombres, colores, semanas):
+        """Build a timeline from consecutive stages and their week counts."""
+        longitudes = np.maximum(0, np.asarray(semanas, dtype=np.int64))
+        return cls(
+            nombres=tuple(nombres),
+            colores=tuple(colores),
+            inicios=solo_lectura(np.cumsum(longitudes) - longitudes),
+            longitudes=solo_lectura(longitudes),
+            ids=solo_lectura(np.arange(len(longitudes))),
+        )
+
+    @property
+    def total_semanas(self):
+        """Total number of weeks in the timeline."""
+        return int(self.longitudes.sum())
+
+    def semanas_en_rango(self, desde, hasta):
+        """Weeks of each run that fall in the week range [desde, hasta)."""
+        return np.maximum(0, np.minimum(self.fines, hasta) - np.maximum(self.inicios, desde))
+
+    def dividir(self, semanas_vividas):
+        """Split each run into (weeks lived, weeks remaining)."""
+        vividas = self.semanas_en_rango(0, semanas_vividas)
+        return vividas, self.longitudes - vividas
+
+    def fines_de_semana(self, desde=0, hasta=None):
+        """Weekends of each run in [desde, hasta); a week holds exactly one weekend."""
+        return self.semanas_en_rango(desde, self.total_semanas if hasta is None else hasta)
+
+    def indice_etapa_actual(self, semanas_vividas):
+        """Index of the first run whose end reaches semanas_vividas, or -1 past the end."""
+        indices = np.searchsorted(self.fines, semanas_vividas, side="left")
+        return _escalar_o_arreglo(np.where(indices < len(self.fines), indices, -1), semanas_vividas)
+
+    def tramo_de_semana(self, semanas):
+        """Run index holding each 0-based week, or -1 outside the timeline."""
+        semanas = np.asarray(semanas)
+        indices = np.searchsorted(self.fines, semanas, side="right")
+        validas = (semanas >= 0) & (indices < len(self.fines))
+        return np.where(validas, indices, -1)
+
+    def etapa_de_semana(self, semanas):
+        """
+        Stage id of each 0-based week, or -1 outside the timeline.
+
+        Accepts a scalar or an array and answers every week with one binary
+        search; use nombres[id] and colores[id] for the stage name and color.
+        """
+        tramos = self.tramo_de_semana(semanas)
+        # El centinela final hace que el tramo -1 devuelva -1
+        return _escalar_o_arreglo(np.append(self.ids, -1)[tramos], semanas)
+
+    def etapa_de_fecha(self, fechas, fecha_nacimiento):
+        """Stage id of the week containing each date, or -1 outside the timeline."""
+        return self.etapa_de_semana(semana_de_fecha(fechas, fecha_nacimiento))
+
+    def semanas_restantes_en_etapa(self, semanas):
+        """Weeks left in the stage after each 0-based week, or 0 outside the timeline."""
+        tramos = self.tramo_de_semana(semanas)
+        restantes = np.where(tramos >= 0, np.append(self.fines, 0)[tramos] - np.asarray(semanas) - 1, 0)
+        return _escalar_o_arreglo(restantes, semanas)
+
+    def expandir(self):
+        """Per-week stage ids, for rendering."""
+        return np.repeat(self.ids, self.longitudes)
+
+
+def semana_de_fecha(fechas, fecha_nacimiento):
+    """0-based week of life of each date (scalar or array)."""
+    dias = np.asarray(fechas, dtype="datetime64[D]") - np.datetime64(fecha_nacimiento, "D")
+    return _escalar_o_arreglo(dias.astype(np.int64) // 7, fechas)
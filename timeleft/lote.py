@@ -0,0 +1,165 @@
+# lote.py
+# Bulk processing of profile CSV files, streamed in chunks.
+#
+# Usage:
+#     python -m timeleft.lote perfiles.csv resultados.csv [--fecha-hoy 2026-01-01] [--bloque 100000]
+#
+# The input needs the columns nombre and fecha_nacimiento (YYYY-MM-DD);
+# esperanza_vida, edad_jubilacion, horas_dormir and horas_trabajo are
+# optional and fall back to the dashboard defaults. Every chunk is computed
+# with numpy over all its rows and appended to the output, so memory stays
+# bounded by the chunk size. Progress and rows/sec go to stderr.
+
+import argparse
+import sys
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from timeleft.calendario import TablaAniversarios, a_datetime64, calcular_semanas_etapas
+from timeleft.config import (
+    EDAD_JUBILACION_DEFAULT,
+    ESPERANZA_VIDA_DEFAULT,
+    HORAS_DORMIR_DEFAULT,
+    HORAS_TRABAJO_DEFAULT,
+)
+from timeleft.etapas import etapas_por_defecto, normalizar_etapas
+
+TAMAÑO_BLOQUE = 100_000
+
+COLUMNAS_SALIDA = [
+    "nombre",
+    "semanas_vividas",
+    "semanas_restantes",
+    "porcentaje_vivido",
+    "etapa_actual",
+    "horas_libres_restantes",
+]
+
+
+def _columna(bloque, nombre, default):
+    """Integer column of bloque, or default when the column or a value is missing."""
+    if nombre not in bloque:
+        return np.full(len(bloque), default, dtype=np.int64)
+    return pd.to_numeric(bloque[nombre], errors="coerce").fillna(default).to_numpy(dtype=np.int64)
+
+
+def _etapas_normalizadas(edad_jubilacion, esperanza_vida):
+    """
+    Default stages of every row, normalized like compute_profile does.
+
+    normalizar_etapas runs once per distinct (edad_jubilacion, esperanza_vida)
+    pair. Rows whose timeline has fewer stages are padded with empty stages,
+    which never hold a week.
+
+    Returns:
+        tuple: (nombres, edades_inicio, edades_fin). nombres has shape
+            (n, k + 1), with "" in the last column for rows past the end;
+            the ages have shape (n, k).
+    """
+    pares, grupos = np.unique(np.stack([edad_jubilacion, esperanza_vida], axis=1), axis=0, return_inverse=True)
+    etapas_grupos = [
+        normalizar_etapas(etapas_por_defecto(int(jubilacion), int(esperanza)), int(esperanza))
+        for jubilacion, esperanza in pares
+    ]
+    k = max((len(etapas) for etapas in etapas_grupos), default=0)
+    nombres = np.full((len(pares), k + 1), "", dtype=object)
+    inicios = np.zeros((len(pares), k), dtype=np.int64)
+    fines = np.zeros((len(pares), k), dtype=np.int64)
+    for grupo, etapas in enumerate(etapas_grupos):
+        for columna, etapa in enumerate(etapas):
+            nombres[grupo, columna] = etapa.nombre
+            inicios[grupo, columna] = etapa.edad_inicio
+            fines[grupo, columna] = etapa.edad_fin
+    grupos = grupos.reshape(-1)
+    return nombres[grupos], inicios[grupos], fines[grupos]
+
+
+def calcular_bloque(bloque, fecha_hoy):
+    """
+    Compute the profile summary of every row of a chunk at once.
+
+    Parameters:
+        bloque (pd.DataFrame): Input rows (see the module header for the columns).
+        fecha_hoy (date): The reference date.
+
+    Returns:
+        pd.DataFrame: One row per input row with COLUMNAS_SALIDA. Rows with an
+            invalid birthdate keep their name and leave the rest empty.
+    """
+    fechas = pd.to_datetime(bloque["fecha_nacimiento"], format="%Y-%m-%d", errors="coerce")
+    validas = fechas.notna().to_numpy()
+    nacimientos = a_datetime64(fechas.fillna(pd.Timestamp(fecha_hoy)).to_numpy())
+    esperanza_vida = _columna(bloque, "esperanza_vida", ESPERANZA_VIDA_DEFAULT)
+    edad_jubilacion = _columna(bloque, "edad_jubilacion", EDAD_JUBILACION_DEFAULT)
+    horas_dormir = _columna(bloque, "horas_dormir", HORAS_DORMIR_DEFAULT)
+    horas_trabajo = _columna(bloque, "horas_trabajo", HORAS_TRABAJO_DEFAULT)
+
+    hoy = a_datetime64(fecha_hoy)
+    aniversarios = TablaAniversarios.desde_nacimientos(nacimientos)
+    fechas_muerte = aniversarios.aniversarios(esperanza_vida[:, None])[:, 0]
+    semanas_totales = (fechas_muerte - nacimientos).astype(np.int64) // 7
+    semanas_vividas = (hoy - nacimientos).astype(np.int64) // 7
+    semanas_restantes = semanas_totales - semanas_vividas
+    with np.errstate(divide="ignore", invalid="ignore"):
+        porcentaje_vivido = np.minimum(100, semanas_vividas / semanas_totales * 100)
+
+    # Etapa actual: la primera cuyo acumulado alcanza las semanas vividas
+    nombres_etapas, edades_inicio, edades_fin = _etapas_normalizadas(edad_jubilacion, esperanza_vida)
+    _, _, semanas_etapas = calcular_semanas_etapas(
+        nacimientos, esperanza_vida, edades_inicio, edades_fin, tabla=aniversarios
+    )
+    alcanzadas = np.cumsum(semanas_etapas, axis=1) >= semanas_vividas[:, None]
+    indices = np.where(alcanzadas.any(axis=1), alcanzadas.argmax(axis=1), nombres_etapas.shape[1] - 1)
+
+    horas_libres_por_semana = (24 - horas_dormir - horas_trabajo) * 5 + 4 * 2
+    resultado = pd.DataFrame({
+        "nombre": bloque["nombre"].to_numpy(),
+        "semanas_vividas": semanas_vividas,
+        "semanas_restantes": semanas_restantes,
+        "porcentaje_vivido": np.round(porcentaje_vivido, 2),
+        "etapa_actual": nombres_etapas[np.arange(len(bloque)), indices],
+        "horas_libres_restantes": horas_libres_por_semana * semanas_restantes,
+    }, columns=COLUMNAS_SALIDA)
+    enteras = ["semanas_vividas", "semanas_restantes", "horas_libres_restantes"]
+    resultado[enteras] = resultado[enteras].astype("Int64")
+    resultado.loc[~validas, COLUMNAS_SALIDA[1:]] = None
+    return resultado
+
+
+def procesar_csv(entrada, salida, fecha_hoy=None, tamaño_bloque=TAMAÑO_BLOQUE, progreso=sys.stderr):
+    """
+    Stream a profile CSV in chunks and write the results incrementally.
+
+    Returns:
+        tuple: (rows processed, seconds elapsed).
+    """
+    fecha_hoy = fecha_hoy or date.today()
+    filas = 0
+    inicio = time.perf_counter()
+    with open(salida, "w", newline="", encoding="utf-8") as archivo_salida:
+        for numero, bloque in enumerate(pd.read_csv(entrada, chunksize=tamaño_bloque, dtype={"nombre": str})):
+            calcular_bloque(bloque, fecha_hoy).to_csv(archivo_salida, header=numero == 0, index=False)
+            filas += len(bloque)
+            transcurrido = time.perf_counter() - inicio
+            if progreso:
+                print(f"{filas:,} filas ({filas / transcurrido:,.0f} filas/s)", file=progreso)
+    return filas, time.perf_counter() - inicio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Procesa un CSV de perfiles en bloques.")
+    parser.add_argument("entrada", help="CSV con nombre y fecha_nacimiento (y opcionalmente esperanza_vida, edad_jubilacion, horas_dormir, horas_trabajo)")
+    parser.add_argument("salida", help="CSV de resultados")
+    parser.add_argument("--fecha-hoy", type=date.fromisoformat, default=None, help="fecha de referencia (YYYY-MM-DD, por defecto hoy)")
+    parser.add_argument("--bloque", type=int, default=TAMAÑO_BLOQUE, help="filas por bloque")
+    args = parser.parse_args(argv)
+
+    filas, segundos = procesar_csv(args.entrada, args.salida, args.fecha_hoy, args.bloque)
+    print(f"✅ {filas:,} filas en {segundos:.2f} s ({filas / max(segundos, 1e-9):,.0f} filas/s) -> {args.salida}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# mortalidad.py
+# This module contains the actuarial life tables: survival probabilities and
+# conditional life expectancy by country, sex and age.
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from timeleft.arreglos import solo_lectura
+from timeleft.config import MORTALIDAD_CACHE_MAX_ENTRIES
+
+RUTA_MORTALIDAD = Path(__file__).parent / "datos" / "mortalidad.csv"
+NOMBRES_PAISES = {"AR": "Argentina", "CL": "Chile", "ES": "España", "MX": "México", "US": "Estados Unidos"}
+SEXOS = {"T": "Sin especificar", "F": "Mujer", "M": "Hombre"}
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class TablaMortalidad:
+    """
+    Life tables by country, sex and year, stored as (tables, ages) arrays.
+
+    Row i is the table of claves[i] = (pais, sexo, año). lx[i, x] is the
+    probability of surviving from birth to exact age x and tx[i, x] the years
+    lived after age x per person born, so the remaining life expectancy at x
+    is tx / lx. Deaths are assumed uniform within each year of age, which
+    makes both exact for fractional ages too. Every query is vectorized over
+    rows and ages.
+    """
+    claves: tuple
+    lx: np.ndarray
+    tx: np.ndarray
+
+    @classmethod
+    def desde_csv(cls, ruta=RUTA_MORTALIDAD):
+        """
+        Load the tables of a CSV with the columns pais, sexo, año, edad and qx.
+
+        Every table must cover the same ages, from 0 on; qx of the last age is
+        taken as 1.
+
+        Parameters:
+            ruta (str or Path): The CSV file; lines starting with # are comments.
+
+        Returns:
+            TablaMortalidad: One row per (pais, sexo, año).
+        """
+        datos = pd.read_csv(ruta, comment="#", dtype={"pais": str, "sexo": str})
+        qx = datos.pivot_table(index=["pais", "sexo", "año"], columns="edad", values="qx", aggfunc="first")
+        if qx.isna().to_numpy().any() or not np.array_equal(qx.columns, np.arange(qx.shape[1])):
+            raise ValueError(f"Tabla de mortalidad incompleta: {ruta}")
+
+        claves = tuple(qx.index)
+        qx = np.clip(qx.to_numpy(dtype=np.float64), 0, 1)
+        qx[:, -1] = 1
+        lx = np.ones((qx.shape[0], qx.shape[1] + 1))
+        np.cumprod(1 - qx, axis=1, out=lx[:, 1:])
+        # Años vividos entre x y x + 1 con muertes uniformes, acumulados desde el final
+        vividos = (lx[:, :-1] + lx[:, 1:]) / 2
+        tx = np.zeros_like(lx)
+        tx[:, :-1] = np.cumsum(vividos[:, ::-1], axis=1)[:, ::-1]
+        return cls(
+            claves=claves,
+            lx=solo_lectura(lx, dtype=np.float64),
+            tx=solo_lectura(tx, dtype=np.float64),
+        )
+
+    @property
+    def edad_maxima(self):
+        """Last age of the tables; nobody survives past it."""
+        return self.lx.shape[1] - 1
+
+    @property
+    def paises(self):
+        """Countries with at least one table, sorted."""
+        return tuple(sorted({pais for pais, _, _ in self.claves}))
+
+    def fila(self, pais, sexo="T", año=None):
+        """
+        Row of the table of a country and sex.
+
+        Parameters:
+            pais (str): Country code, e.g. "CL".
+            sexo (str): "F", "M" or "T" (both).
+            año (int): Latest year to use; the most recent table by default.
+
+        Returns:
+            int: The row index.
+        """
+        candidatas = [
+            (clave[2], fila) for fila, clave in enumerate(self.claves)
+            if clave[:2] == (pais, sexo) and (año is None or clave[2] <= año)
+        ]
+        if not candidatas:
+            raise KeyError(f"No hay tabla de mortalidad para {pais!r}, {sexo!r}, {año!r}")
+        return max(candidatas)[1]
+
+    def _interpolar(self, valores, fila, edades):
+        """Linear interpolation of a per-age array such as lx at fractional ages."""
+        edades = np.clip(np.asarray(edades, dtype=np.float64), 0, self.edad_maxima)
+        enteras = np.minimum(edades.astype(np.int64), self.edad_maxima - 1)
+        fraccion = edades - enteras
+        return valores[fila, enteras] * (1 - fraccion) + valores[fila, enteras + 1] * fraccion
+
+    def supervivencia(self, fila, edad_actual, edades):
+        """
+        Probability of being alive at each age, given alive at edad_actual.
+
+        Parameters:
+            fila (int or array-like): Table row(s), see fila().
+            edad_actual (float or array-like): Current age in years.
+            edades (float or array-like): Ages to evaluate; ages before
+                edad_actual have probability 1. All arguments broadcast.
+
+        Returns:
+            np.ndarray: Probabilities in [0, 1].
+        """
+        edades = np.maximum(edades, edad_actual)
+        vivos = self._interpolar(self.lx, fila, edad_actual)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(vivos > 0, self._interpolar(self.lx, fila, edades) / vivos, 0.0)
+
+    def edad_para_supervivencia(self, fila, edad_actual, probabilidades):
+        """
+        Age at which the survival probability from edad_actual drops to each value.
+
+        This is the inverse of supervivencia(), so uniform probabilities give
+        ages at death distributed as in the table.
+
+        Parameters:
+            fila (int): Table row, see fila().
+            edad_actual (float): Current age in years.
+            probabilidades (array-like): Survival probabilities in [0, 1].
+
+        Returns:
+            np.ndarray: Ages in [edad_actual, edad_maxima].
+        """
+        sobrevivientes = self.lx[fila]
+        objetivo = np.asarray(probabilidades, dtype=np.float64) * self._interpolar(self.lx, fila, edad_actual)
+        # Primera edad entera en la que quedan objetivo sobrevivientes o menos (lx es decreciente)
+        fin = np.clip(np.searchsorted(-sobrevivientes, -objetivo, side="left"), 1, self.edad_maxima)
+        caida = sobrevivientes[fin - 1] - sobrevivientes[fin]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fraccion = np.where(caida > 0, (sobrevivientes[fin - 1] - objetivo) / caida, 1.0)
+        return np.clip(fin - 1 + fraccion, edad_actual, self.edad_maxima)
+
+    def esperanza_restante(self, fila, edades):
+        """
+        Remaining life expectancy in years at each age.
+
+        Parameters:
+            fila (int or array-like): Table row(s), see fila().
+            edades (float or array-like): Ages in years; broadcasts with fila.
+
+        Returns:
+            np.ndarray: Expected years left; 0 from edad_maxima on.
+        """
+        vivos = self._interpolar(self.lx, fila, edades)
+        # Años vividos después de la edad: tx interpolado con la misma hipótesis uniforme
+        edades = np.clip(np.asarray(edades, dtype=np.float64), 0, self.edad_maxima)
+        enteras = np.minimum(edades.astype(np.int64), self.edad_maxima - 1)
+        restantes = self.tx[fila, enteras + 1] + (enteras + 1 - edades) * (vivos + self.lx[fila, enteras + 1]) / 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(vivos > 0, restantes / vivos, 0.0)
+
+
+@lru_cache(maxsize=None)
+def cargar_tabla_mortalidad(ruta=RUTA_MORTALIDAD):
+    """The TablaMortalidad of a CSV, loaded once per path."""
+    return TablaMortalidad.desde_csv(ruta)
+
+
+@lru_cache(maxsize=MORTALIDAD_CACHE_MAX_ENTRIES)
+def esperanza_vida_para_edad(pais, sexo, edad, año=None):
+    """
+    Expected age at death of someone alive at edad, from the bundled tables.
+
+    Parameters:
+        pais (str): Country code, e.g. "CL".
+        sexo (str): "F", "M" or "T" (both).
+        edad (float): Current age in years.
+        año (int): Latest table year to use; the most recent by default.
+
+    Returns:
+        float: edad plus the remaining life expectancy.
+    """
+    tabla = cargar_tabla_mortalidad()
+    return float(edad + tabla.esperanza_restante(tabla.fila(pais, sexo, año), edad))
@@ -0,0 +1,243 @@
+# perfil.py
+# This module contains the pure profile computation behind the dashboard.
+
+import hashlib
+from dataclasses import dataclass, field, fields
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from timeleft.calendario import TablaAniversarios, a_datetime64, calcular_calendario
+from timeleft.etapas import Etapa, etapas_por_defecto, normalizar_etapas
+from timeleft.horas import IndiceHoras
+from timeleft.insights import generar_insights
+from timeleft.linea_tiempo import LineaTiempo
+
+
+@dataclass(frozen=True, slots=True)
+class EntradaPerfil:
+    """
+    Immutable inputs of compute_profile, used as the cache key of a profile.
+
+    Stages are stored as a tuple of Etapa. The content digest in clave is
+    computed once, so hashing an EntradaPerfil is cheap and stable across
+    processes (it does not depend on PYTHONHASHSEED).
+    """
+    nombre: str
+    fecha_nacimiento: date
+    esperanza_vida: int
+    edad_jubilacion: int
+    horas_dormir_por_dia: int
+    horas_trabajo_por_dia: int
+    etapas: tuple
+    fecha_hoy: date
+    clave: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "etapas", tuple(Etapa.desde(etapa) for etapa in self.etapas))
+        contenido = repr(tuple(getattr(self, campo.name) for campo in fields(self) if campo.compare))
+        object.__setattr__(self, "clave", hashlib.blake2b(contenido.encode("utf-8"), digest_size=16).hexdigest())
+
+    def __hash__(self):
+        return hash(self.clave)
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class Perfil:
+    """Immutable result of compute_profile with every value the dashboard shows."""
+    nombre: str
+    semanas_totales: int
+    semanas_vividas: int
+    semanas_restantes: int
+    dias_vividos: int
+    porcentaje_vivido: float
+    años_restantes: int
+    horas_tiempo_personal_habiles: int
+    horas_libres_por_semana: int
+    horas_restantes: int
+    dias_libres_estimados: int
+    etapa_actual: object
+    semanas_restantes_en_etapa: int
+    dias_restantes_en_etapa: int
+    calendario: pd.DataFrame
+    linea_tiempo: LineaTiempo
+    indice_horas: IndiceHoras
+    tabla_etapas: pd.DataFrame
+    horas_trabajo_futuro: int
+    horas_personales_restantes: int
+    insights: tuple
+    _figuras: dict = field(default_factory=dict, init=False, repr=False)
+
+    def figuras(self):
+        """
+        The Plotly figures of the profile, built on first use.
+
+        Plotly is only imported here, so profiles used without charts (batch
+        jobs, APIs) never load it.
+
+        Returns:
+            dict: fig_barras, fig_circulos, fig_distribucion and fig_tiempo_restante.
+        """
+        if not self._figuras:
+            from timeleft.figuras import crear_figuras_perfil
+            self._figuras.update(crear_figuras_perfil(self))
+        return self._figuras
+
+    @property
+    def fig_barras(self):
+        """Stacked bar of the weeks per stage with the current week."""
+        return self.figuras()["fig_barras"]
+
+    @property
+    def fig_circulos(self):
+        """Circle chart of every week of life."""
+        return self.figuras()["fig_circulos"]
+
+    @property
+    def fig_distribucion(self):
+        """Pie of the hours per category, for the whole life and each stage."""
+        return self.figuras()["fig_distribucion"]
+
+    @property
+    def fig_tiempo_restante(self):
+        """Pie of the future work and personal hours."""
+        return self.figuras()["fig_tiempo_restante"]
+
+    @property
+    def etapas(self):
+        """Weeks per stage, keyed by stage name."""
+        return self.calendario["Semanas"].to_dict()
+
+    @property
+    def colors(self):
+        """Color per stage, keyed by stage name."""
+        return self.calendario["Color"].to_dict()
+
+    @property
+    def fines_semana_por_etapa(self):
+        """Weekends lived per stage, keyed by stage name."""
+        return self.calendario["Semanas vividas"].to_dict()
+
+
+def compute_profile(nombre, fecha_nacimiento, esperanza_vida, edad_jubilacion,
+                    horas_dormir_por_dia, horas_trabajo_por_dia, etapas, fecha_hoy):
+    """
+    Compute every KPI, table and insight of the dashboard for one profile.
+
+    The figures are built on first access (see Perfil.figuras). All arguments
+    are hashable so the function can be memoized by st.cache_data.
+
+    Parameters:
+        nombre (str): The person's name.
+        fecha_nacimiento (date): The birthdate.
+        esperanza_vida (int): Life expectancy in years.
+        edad_jubilacion (int): Retirement age in years.
+        horas_dormir_por_dia (int): Average hours of sleep per day.
+        horas_trabajo_por_dia (int): Average hours of work per day.
+        etapas (tuple): User stages as Etapa objects or (nombre, edad_inicio, edad_fin, color) tuples.
+            They are the only stages of the profile and go through
+            normalizar_etapas; an empty tuple uses etapas_por_defecto.
+        fecha_hoy (date): The reference date.
+
+    Returns:
+        Perfil: The computed profile.
+    """
+    nacimiento = a_datetime64(fecha_nacimiento)
+    hoy = a_datetime64(fecha_hoy)
+    fecha_muerte = TablaAniversarios.desde_nacimientos(nacimiento).aniversarios(esperanza_vida)
+
+    semanas_totales = int((fecha_muerte - nacimiento).astype(np.int64) // 7)
+    dias_vividos = int((hoy - nacimiento).astype(np.int64))
+    semanas_vividas = dias_vividos // 7
+    semanas_restantes = semanas_totales - semanas_vividas
+
+    # Calcular horas libres por semana considerando fines de semana
+    horas_tiempo_personal_habiles = 24 - horas_dormir_por_dia - int(horas_trabajo_por_dia)
+    tiempo_libre_diario = 4  # Valor predeterminado en horas por día
+    horas_libres_por_semana = horas_tiempo_personal_habiles * 5 + tiempo_libre_diario * 2
+    horas_restantes = horas_libres_por_semana * semanas_restantes
+    dias_libres_estimados = horas_restantes // 24
+
+    porcentaje_vivido = min(100, (semanas_vividas / semanas_totales) * 100)
+    años_restantes = max(0, int((fecha_muerte - hoy).astype(np.int64)) // 365)
+
+    # Las etapas recibidas son las únicas del perfil; sin etapas se usan las fijas
+    etapas_normalizadas = normalizar_etapas(etapas or etapas_por_defecto(edad_jubilacion, esperanza_vida), esperanza_vida)
+    calendario = calcular_calendario(nacimiento, esperanza_vida, etapas_normalizadas, hoy)
+    linea_tiempo = LineaTiempo.desde_semanas(calendario.index, calendario["Color"], calendario["Semanas"])
+
+    tabla_etapas = calendario[["Semanas"]].copy()
+    total_semanas = tabla_etapas["Semanas"].sum()
+    tabla_etapas["Porcentaje"] = (tabla_etapas["Semanas"] / total_semanas * 100).round(2)
+    tabla_etapas["Porcentaje acumulado"] = tabla_etapas["Porcentaje"].cumsum().round(2)
+
+    # Etapa actual: la primera cuyo acumulado alcanza las semanas vividas
+    indice_actual = linea_tiempo.indice_etapa_actual(semanas_vividas)
+    if indice_actual >= 0:
+        etapa_actual = linea_tiempo.nombres[indice_actual]
+        semanas_restantes_en_etapa = max(0, int(linea_tiempo.fines[indice_actual]) - semanas_vividas)
+    else:
+        etapa_actual = None
+        semanas_restantes_en_etapa = 0
+    dias_restantes_en_etapa = semanas_restantes_en_etapa * 7
+
+    # Horas de sueño, trabajo y tiempo personal con las horas elegidas; lo restante va
+    # desde la semana actual hasta el final de la línea de tiempo
+    indice_horas = IndiceHoras.desde_linea_tiempo(linea_tiempo, horas_dormir_por_dia, int(horas_trabajo_por_dia))
+    _, horas_trabajo_futuro, horas_personales_restantes = (
+        int(horas) for horas in indice_horas.horas(semanas_vividas, indice_horas.total_semanas)
+    )
+
+    insights = generar_insights(porcentaje_vivido, años_restantes, semanas_vividas, semanas_restantes, dias_vividos)
+
+    return Perfil(
+        nombre=nombre,
+        semanas_totales=semanas_totales,
+        semanas_vividas=semanas_vividas,
+        semanas_restantes=semanas_restantes,
+        dias_vividos=dias_vividos,
+        porcentaje_vivido=porcentaje_vivido,
+        años_restantes=años_restantes,
+        horas_tiempo_personal_habiles=horas_tiempo_personal_habiles,
+        horas_libres_por_semana=horas_libres_por_semana,
+        horas_restantes=horas_restantes,
+        dias_libres_estimados=dias_libres_estimados,
+        etapa_actual=etapa_actual,
+        semanas_restantes_en_etapa=semanas_restantes_en_etapa,
+        dias_restantes_en_etapa=dias_restantes_en_etapa,
+        calendario=calendario,
+        linea_tiempo=linea_tiempo,
+        indice_horas=indice_horas,
+        tabla_etapas=tabla_etapas,
+        horas_trabajo_futuro=horas_trabajo_futuro,
+        horas_personales_restantes=horas_personales_restantes,
+        insights=insights,
+    )
+
+
+def calcular_perfil(entrada):
+    """
+    Compute the profile of an EntradaPerfil, with its figures already built.
+
+    This is the entry point the dashboard caches, so the cached profile
+    carries the figures too.
+
+    Parameters:
+        entrada (EntradaPerfil): The profile inputs.
+
+    Returns:
+        Perfil: The computed profile, same as compute_profile.
+    """
+    perfil = compute_profile(
+        entrada.nombre,
+        entrada.fecha_nacimiento,
+        entrada.esperanza_vida,
+        entrada.edad_jubilacion,
+        entrada.horas_dormir_por_dia,
+        entrada.horas_trabajo_por_dia,
+        entrada.etapas,
+        entrada.fecha_hoy,
+    )
+    perfil.figuras()
+    return perfil
@@ -0,0 +1,172 @@
+# posters.py
+# Parallel batch export of "semanas de vida" PDF posters with matplotlib.
+#
+# Usage:
+#     python -m timeleft.posters perfiles.csv carpeta_posters [--procesos 8] [--fecha-hoy 2026-01-01]
+#
+# The input CSV has the same columns as timeleft.lote. Profiles are fanned out
+# over a ProcessPoolExecutor; every worker uses the non-interactive Agg
+# backend and builds one figure/axes template that it reuses for all of its
+# posters, only updating the points, colors and texts. Progress is streamed
+# to stderr as posters are finished.
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from timeleft.calendario import TablaAniversarios, a_datetime64, calcular_calendario
+from timeleft.config import EDAD_JUBILACION_DEFAULT, ESPERANZA_VIDA_DEFAULT
+from timeleft.etapas import etapas_por_defecto, normalizar_etapas
+from timeleft.grilla import hex_a_rgb
+
+COLUMNAS_POSTER = 100
+LOTE_POR_WORKER = 16
+
+# Plantilla del worker: (fig, ax, puntos, texto_kpi), creada una vez por proceso
+_plantilla = None
+
+
+def _iniciar_worker():
+    """Create the reusable figure template of this worker process."""
+    global _plantilla
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(18, 6))
+    puntos = ax.scatter([], [], s=20)
+    ax.axis("off")
+    texto_kpi = fig.text(0.02, 0.85, "", fontsize=14, bbox=dict(facecolor='white', alpha=0.7))
+    fig.subplots_adjust(left=0.02, right=0.98, top=0.92, bottom=0.15)
+    _plantilla = (fig, ax, puntos, texto_kpi)
+
+
+def nombre_archivo(nombre, indice):
+    """PDF file name of a poster, unique per input row."""
+    base = str(nombre).lower().replace(' ', '_').replace(os.sep, '_')
+    return f"semanas_de_vida_{base}_{indice}.pdf"
+
+
+def dibujar_poster(perfil, carpeta, fecha_hoy):
+    """
+    Draw one poster on the worker template and save it as PDF.
+
+    Parameters:
+        perfil (tuple): (indice, nombre, fecha_nacimiento, esperanza_vida, edad_jubilacion).
+        carpeta (str): Output folder.
+        fecha_hoy (date): The reference date.
+
+    Returns:
+        str: Path of the saved PDF.
+    """
+    import matplotlib.patches as mpatches
+
+    if _plantilla is None:
+        _iniciar_worker()
+    fig, ax, puntos, texto_kpi = _plantilla
+    indice, nombre, fecha_nacimiento, esperanza_vida, edad_jubilacion = perfil
+
+    etapas = [
+        (f"{nombre_etapa} ({edad_ini}-{edad_fin})", edad_ini, edad_fin, color)
+        for nombre_etapa, edad_ini, edad_fin, color
+        in normalizar_etapas(etapas_por_defecto(edad_jubilacion, esperanza_vida), esperanza_vida)
+    ]
+    calendario = calcular_calendario(fecha_nacimiento, esperanza_vida, etapas, fecha_hoy)
+    semanas = calendario["Semanas"].to_numpy()
+    total_semanas = int(semanas.sum())
+
+    # Grilla
+    rows = (total_semanas // COLUMNAS_POSTER) + 1
+    x = np.tile(np.arange(COLUMNAS_POSTER), rows)[:total_semanas]
+    y = np.repeat(np.arange(rows), COLUMNAS_POSTER)[:total_semanas]
+    puntos.set_offsets(np.column_stack([x, -y]))
+    puntos.set_facecolors(np.repeat(hex_a_rgb(calendario["Color"]), semanas, axis=0) / 255)
+    ax.set_xlim(-1, COLUMNAS_POSTER)
+    ax.set_ylim(-rows, 1)
+    ax.set_title(f"Semana de vida de {nombre}")
+
+    # KPIs
+    semanas_vividas = int(calendario["Semanas vividas"].sum())
+    semanas_restantes = total_semanas - semanas_vividas
+    porcentaje_vivido = min(100, (semanas_vividas / total_semanas) * 100) if total_semanas else 100
+    fecha_muerte = TablaAniversarios.desde_nacimientos(fecha_nacimiento).aniversarios(esperanza_vida)
+    años_restantes = max(0, int((fecha_muerte - a_datetime64(fecha_hoy)).astype(np.int64)) // 365)
+    texto_kpi.set_text(
+        f"% de vida vivido: {porcentaje_vivido:.2f}%\n"
+        f"Semanas vividas: {semanas_vividas}\n"
+        f"Semanas restantes: {semanas_restantes}\n"
+        f"Años restantes: {años_restantes}"
+    )
+
+    # Leyenda
+    legend_patches = [mpatches.Patch(color=col, label=etapa) for etapa, col in calendario["Color"].items()]
+    leyenda = ax.legend(handles=legend_patches, loc='lower center', bbox_to_anchor=(0.5, -0.15), ncol=3)
+
+    ruta = os.path.join(carpeta, nombre_archivo(nombre, indice))
+    fig.savefig(ruta, format='pdf')
+    leyenda.remove()
+    return ruta
+
+
+def _dibujar_lote(perfiles, carpeta, fecha_hoy):
+    """Draw a batch of posters in one task to cut inter-process overhead."""
+    return [dibujar_poster(perfil, carpeta, fecha_hoy) for perfil in perfiles]
+
+
+def leer_perfiles(entrada):
+    """Read profile tuples for dibujar_poster from a CSV, skipping invalid birthdates."""
+    tabla = pd.read_csv(entrada, dtype={"nombre": str})
+    fechas = pd.to_datetime(tabla["fecha_nacimiento"], format="%Y-%m-%d", errors="coerce")
+    esperanza_vida = tabla.get("esperanza_vida", pd.Series(ESPERANZA_VIDA_DEFAULT, index=tabla.index))
+    edad_jubilacion = tabla.get("edad_jubilacion", pd.Series(EDAD_JUBILACION_DEFAULT, index=tabla.index))
+    esperanza_vida = pd.to_numeric(esperanza_vida, errors="coerce").fillna(ESPERANZA_VIDA_DEFAULT).astype(int)
+    edad_jubilacion = pd.to_numeric(edad_jubilacion, errors="coerce").fillna(EDAD_JUBILACION_DEFAULT).astype(int)
+    return [
+        (indice, nombre, fecha.date(), int(esperanza), int(jubilacion))
+        for indice, nombre, fecha, esperanza, jubilacion
+        in zip(tabla.index, tabla["nombre"], fechas, esperanza_vida, edad_jubilacion)
+        if not pd.isna(fecha)
+    ]
+
+
+def generar_posters(perfiles, carpeta, procesos=None, fecha_hoy=None, progreso=sys.stderr):
+    """
+    Export one PDF poster per profile using a pool of worker processes.
+
+    Returns:
+        tuple: (posters written, seconds elapsed).
+    """
+    fecha_hoy = fecha_hoy or date.today()
+    os.makedirs(carpeta, exist_ok=True)
+    lotes = [perfiles[i:i + LOTE_POR_WORKER] for i in range(0, len(perfiles), LOTE_POR_WORKER)]
+    hechos = 0
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_worker) as executor:
+        for rutas in executor.map(_dibujar_lote, lotes, [carpeta] * len(lotes), [fecha_hoy] * len(lotes)):
+            hechos += len(rutas)
+            if progreso:
+                transcurrido = time.perf_counter() - inicio
+                print(f"{hechos:,}/{len(perfiles):,} posters ({hechos / transcurrido:,.1f} posters/s)", file=progreso)
+    return hechos, time.perf_counter() - inicio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera posters PDF de semanas de vida en paralelo.")
+    parser.add_argument("entrada", help="CSV con nombre, fecha_nacimiento y opcionalmente esperanza_vida y edad_jubilacion")
+    parser.add_argument("carpeta", help="carpeta de salida de los PDF")
+    parser.add_argument("--procesos", type=int, default=None, help="procesos en paralelo (por defecto, uno por núcleo)")
+    parser.add_argument("--fecha-hoy", type=date.fromisoformat, default=None, help="fecha de referencia (YYYY-MM-DD, por defecto hoy)")
+    args = parser.parse_args(argv)
+
+    hechos, segundos = generar_posters(leer_perfiles(args.entrada), args.carpeta, args.procesos, args.fecha_hoy)
+    print(f"✅ {hechos:,} posters en {segundos:.1f} s ({hechos / max(segundos, 1e-9):,.1f} posters/s) -> {args.carpeta}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+# reloj.py
+# This module contains the clock epoch: today quantized to the day boundary
+# that the dashboard values actually depend on.
+
+from dataclasses import dataclass
+from datetime import date, datetime
+
+
+@dataclass(frozen=True, slots=True)
+class EpocaReloj:
+    """
+    The current day, as the only notion of "now" that reaches cache keys.
+
+    Days lived change once per day, so keying caches on the raw clock would
+    miss on every rerun. An epoch compares equal all day long and changes
+    exactly at midnight. Week-granular caches, such as the weekly figures of
+    perfil.py, are keyed on the weeks lived derived from this day.
+    """
+    dia: date
+
+    @classmethod
+    def ahora(cls, ahora=None):
+        """
+        Epoch of a moment.
+
+        Parameters:
+            ahora (datetime): The moment to quantize; local time now by default.
+
+        Returns:
+            EpocaReloj: The epoch of that moment's day.
+        """
+        ahora = ahora or datetime.now()
+        return cls(ahora.date() if isinstance(ahora, datetime) else ahora)
@@ -0,0 +1,120 @@
+# simulacion.py
+# This module contains the Monte Carlo simulation of the remaining lifespan.
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from timeleft.arreglos import solo_lectura
+from timeleft.config import SIMULACION_CACHE_MAX_ENTRIES, SIMULACION_MUESTRAS
+from timeleft.mortalidad import cargar_tabla_mortalidad
+
+DIAS_POR_AÑO = 365.25
+PERCENTILES = {"P10": 10, "Mediana": 50, "P90": 90}
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class SimulacionVida:
+    """
+    Monte Carlo draws of the weeks left to live of one person.
+
+    semanas_restantes is sorted, so survival and percentile queries are
+    binary searches over the draws.
+    """
+    semanas_restantes: np.ndarray
+    horas_libres_por_semana: int
+
+    @property
+    def muestras(self):
+        """Number of draws."""
+        return len(self.semanas_restantes)
+
+    def supervivencia(self, semanas):
+        """
+        Share of the draws still alive at the start of each future week.
+
+        Parameters:
+            semanas (int or array-like): Weeks from now; 0 is the current
+                week and negative weeks are in the past (probability 1).
+
+        Returns:
+            np.ndarray: Probabilities in [0, 1].
+        """
+        muertes = np.searchsorted(self.semanas_restantes, semanas, side="left")
+        return 1 - muertes / self.muestras
+
+    def supervivencia_grilla(self, semanas_vividas, semanas_totales):
+        """
+        Survival probability of every week of the life grid.
+
+        Weeks lived, including the current one, have probability 1.
+
+        Returns:
+            np.ndarray: One probability per week, semanas_totales of them.
+        """
+        return self.supervivencia(np.arange(semanas_totales) - (semanas_vividas - 1))
+
+    def resumen(self):
+        """
+        Percentiles of the weeks, weekends and free hours left.
+
+        Returns:
+            pd.DataFrame: One row per quantity, one column per PERCENTILES key.
+        """
+        semanas = np.percentile(self.semanas_restantes, list(PERCENTILES.values()), method="lower")
+        return pd.DataFrame(
+            [semanas, semanas, semanas * self.horas_libres_por_semana],
+            index=["Semanas restantes", "Fines de semana restantes", "Horas libres restantes"],
+            columns=list(PERCENTILES),
+        )
+
+
+def simular_semanas_restantes(tabla, fila, edad_actual, muestras=SIMULACION_MUESTRAS, semilla=0):
+    """
+    Draw weeks left to live from a life table, conditioned on the current age.
+
+    Ages at death come from inverting the survival curve at uniform draws, so
+    the work is one vectorized binary search over the table for all draws.
+
+    Parameters:
+        tabla (TablaMortalidad): The life tables.
+        fila (int): Table row, see TablaMortalidad.fila().
+        edad_actual (float): Current age in years.
+        muestras (int): Number of draws.
+        semilla (int): Seed of the random generator.
+
+    Returns:
+        np.ndarray: Sorted int64 weeks left, one per draw.
+    """
+    uniformes = np.random.default_rng(semilla).random(muestras)
+    edades_muerte = tabla.edad_para_supervivencia(fila, edad_actual, uniformes)
+    semanas = ((edades_muerte - edad_actual) * DIAS_POR_AÑO // 7).astype(np.int64)
+    semanas.sort()
+    return semanas
+
+
+@lru_cache(maxsize=SIMULACION_CACHE_MAX_ENTRIES)
+def simular_vida(pais, sexo, edad_actual, horas_libres_por_semana, muestras=SIMULACION_MUESTRAS, semilla=0, año=None):
+    """
+    Simulate the remaining lifespan with the bundled life tables.
+
+    Results are cached per profile and seed: the same arguments return the
+    same SimulacionVida.
+
+    Parameters:
+        pais (str): Country code, e.g. "CL".
+        sexo (str): "F", "M" or "T" (both).
+        edad_actual (float): Current age in years.
+        horas_libres_por_semana (int): Free hours per week.
+        muestras (int): Number of draws.
+        semilla (int): Seed of the random generator.
+        año (int): Latest table year to use; the most recent by default.
+
+    Returns:
+        SimulacionVida: The draws.
+    """
+    tabla = cargar_tabla_mortalidad()
+    semanas = simular_semanas_restantes(tabla, tabla.fila(pais, sexo, año), edad_actual, muestras, semilla)
+    return SimulacionVida(semanas_restantes=solo_lectura(semanas), horas_libres_por_semana=horas_libres_por_semana)
@@ -0,0 +1,100 @@
+# tiempo_esperado.py
+# This module contains the survival-weighted expected free time: hours, days,
+# weekends and books left, weighted by the probability of living each week.
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from timeleft.arreglos import solo_lectura
+from timeleft.config import HORAS_POR_LIBRO, MORTALIDAD_CACHE_MAX_ENTRIES
+from timeleft.mortalidad import cargar_tabla_mortalidad
+from timeleft.simulacion import DIAS_POR_AÑO
+
+
+@dataclass(frozen=True, slots=True)
+class TiempoEsperado:
+    """Expected remaining quantities, each week counted by its survival probability."""
+    semanas: float
+    fines_de_semana: float
+    horas_libres: float
+    dias_libres: float
+    libros: float
+
+
+def supervivencia_semanal(tabla, fila, edad_actual):
+    """
+    Probability of being alive at the start of every future week.
+
+    Week 0 is the current one (probability 1); the last week is the one in
+    which the table's maximum age is reached.
+
+    Parameters:
+        tabla (TablaMortalidad): The life tables.
+        fila (int): Table row, see TablaMortalidad.fila().
+        edad_actual (float): Current age in years.
+
+    Returns:
+        np.ndarray: One probability per future week.
+    """
+    semanas = max(1, int(np.ceil((tabla.edad_maxima - edad_actual) * DIAS_POR_AÑO / 7)))
+    edades = edad_actual + np.arange(semanas) * 7 / DIAS_POR_AÑO
+    return tabla.supervivencia(fila, edad_actual, edades)
+
+
+def calcular_tiempo_esperado(supervivencia, horas_libres_por_semana, horas_por_libro=HORAS_POR_LIBRO):
+    """
+    Expected weeks, weekends, free hours, free days and books left.
+
+    Parameters:
+        supervivencia (array-like): Survival probability of each future week,
+            e.g. from supervivencia_semanal().
+        horas_libres_por_semana (float or array-like): Free hours per week,
+            constant or one value per future week.
+        horas_por_libro (float): Hours needed to read a book.
+
+    Returns:
+        TiempoEsperado: The expected values.
+    """
+    supervivencia = np.asarray(supervivencia, dtype=np.float64)
+    semanas = float(supervivencia.sum())
+    if np.ndim(horas_libres_por_semana) == 0:
+        horas_libres = semanas * horas_libres_por_semana
+    else:
+        horas_libres = float(np.dot(supervivencia, np.asarray(horas_libres_por_semana, dtype=np.float64)))
+    return TiempoEsperado(
+        semanas=semanas,
+        fines_de_semana=semanas,
+        horas_libres=horas_libres,
+        dias_libres=horas_libres / 24,
+        libros=horas_libres / horas_por_libro,
+    )
+
+
+@lru_cache(maxsize=MORTALIDAD_CACHE_MAX_ENTRIES)
+def _supervivencia_semanal_cacheada(pais, sexo, edad_actual, año):
+    """Read-only supervivencia_semanal of the bundled tables."""
+    tabla = cargar_tabla_mortalidad()
+    return solo_lectura(supervivencia_semanal(tabla, tabla.fila(pais, sexo, año), edad_actual), dtype=np.float64)
+
+
+def tiempo_esperado(pais, sexo, edad_actual, horas_libres_por_semana, año=None):
+    """
+    Expected free time left with the bundled life tables.
+
+    The survival curve is cached per country, sex and age, so changing the
+    hours only costs a dot product.
+
+    Parameters:
+        pais (str): Country code, e.g. "CL".
+        sexo (str): "F", "M" or "T" (both).
+        edad_actual (float): Current age in years.
+        horas_libres_por_semana (float or array-like): Free hours per week.
+        año (int): Latest table year to use; the most recent by default.
+
+    Returns:
+        TiempoEsperado: The expected values.
+    """
+    supervivencia = _supervivencia_semanal_cacheada(pais, sexo, edad_actual, año)
+    return calcular_tiempo_esperado(supervivencia, horas_libres_por_semana)
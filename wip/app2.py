@@ -154,9 +154,8 @@ df["Porcentaje acumulado"] = df["Porcentaje"].cumsum().round(2)
 
 # Colores por semana
 total_weeks = int(df["Semanas"].sum())
-color_list = []
-for etapa, row in df.iterrows():
-    color_list.extend([colors[etapa]] * int(row["Semanas"]))
+# Las etapas son tramos contiguos: se expanden a colores por semana de una vez
+color_list = np.repeat([colors[etapa] for etapa in df.index], df["Semanas"].astype(int))
 
 cols = 100
 rows = (total_weeks // cols) + 1
@@ -170,16 +169,9 @@ porcentaje_vivido = min(100, (semanas_vividas / total_semanas) * 100)
 años_restantes = max(0, (fecha_muerte_estimada - fecha_hoy).days // 365)
 
 # Fines de semana vividos por etapa
-fines_semana_por_etapa = {}
-semanas_acumuladas = 0
-for etapa, row in df.iterrows():
-    semanas_etapa = int(row["Semanas"])
-    if semanas_vividas > semanas_acumuladas:
-        vividas = min(semanas_etapa, semanas_vividas - semanas_acumuladas)
-    else:
-        vividas = 0
-    fines_semana_por_etapa[etapa] = vividas
-    semanas_acumuladas += semanas_etapa
+semanas_etapa = df["Semanas"].astype(int).to_numpy()
+semanas_inicio = np.cumsum(semanas_etapa) - semanas_etapa
+fines_semana_por_etapa = dict(zip(df.index, np.clip(semanas_vividas - semanas_inicio, 0, semanas_etapa).tolist()))
 
 # Mejorar la UX: centrado, paddings, tarjetas y colores suaves
 st.markdown("""